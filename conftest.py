@@ -1,43 +1,67 @@
 """Pytest configuration and shared fixtures."""
 
 import os
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 
+@pytest.fixture(scope="session")
+def _prompts_template(tmp_path_factory):
+    """Create the test prompt files once per session.
+
+    Read-only tests can depend on this directly; tests that mutate files
+    should use temp_prompts_dir for an isolated copy.
+    """
+    # Raw os/open calls rather than pathlib: the wrapper overhead is
+    # measurable for fixtures this hot
+    prompts_dir = os.path.join(str(tmp_path_factory.mktemp("prompts_template")), "prompts")
+    os.mkdir(prompts_dir)
+
+    # Create test prompt files
+    with open(os.path.join(prompts_dir, "greeting.txt"), "w") as f:
+        f.write("Hello {name}!")
+    with open(os.path.join(prompts_dir, "welcome.txt"), "w") as f:
+        f.write("Welcome to our service")
+
+    return prompts_dir
+
+
 @pytest.fixture
-def temp_prompts_dir():
-    """Create a temporary directory with test prompt files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        prompts_dir = Path(tmpdir) / "prompts"
-        prompts_dir.mkdir()
-        
-        # Create test prompt files
-        (prompts_dir / "greeting.txt").write_text("Hello {name}!")
-        (prompts_dir / "welcome.txt").write_text("Welcome to our service")
-        
-        yield str(prompts_dir)
+def temp_prompts_dir(_prompts_template, tmp_path):
+    """Per-test copy of the session prompt template."""
+    prompts_dir = os.path.join(str(tmp_path), "prompts")
+    shutil.copytree(_prompts_template, prompts_dir)
+    yield prompts_dir
 
 
 @pytest.fixture
 def mock_openai_client():
-    """Mock OpenAI client for testing."""
-    with patch("prompt_manager.sources.openai.OpenAI") as mock_class:
-        mock_client = Mock()
-        mock_class.return_value = mock_client
-        
-        # Mock response structure
-        mock_response = Mock()
-        mock_response.instructions = [Mock()]
-        mock_response.instructions[0].content = [Mock()]
-        mock_response.instructions[0].content[0].text = "Test prompt content"
-        
-        mock_client.responses.create.return_value = mock_response
-        
-        yield mock_client
+    """Mock OpenAI client for testing.
+
+    A plain SimpleNamespace tree stands in for the client; Mock's child
+    auto-creation is overkill here and noticeably slower to build.
+    """
+    # Mock response structure
+    response = SimpleNamespace(
+        instructions=[
+            SimpleNamespace(content=[SimpleNamespace(text="Test prompt content")])
+        ]
+    )
+    client = SimpleNamespace(
+        responses=SimpleNamespace(create=lambda **kwargs: response)
+    )
+
+    # The module-level client pool would otherwise serve this mock (or a
+    # real client) to later tests sharing the same api-key digest
+    from prompt_manager.sources.openai import clear_client_cache
+
+    clear_client_cache()
+    with patch("prompt_manager.sources.openai.OpenAI", return_value=client):
+        yield client
+    clear_client_cache()
 
 
 @pytest.fixture
@@ -57,18 +81,34 @@ def sample_config(temp_prompts_dir):
     }
 
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "resets_singletons: reset global config/manager singletons around the test",
+    )
+
+
 @pytest.fixture(autouse=True)
-def reset_singletons():
-    """Reset singleton instances between tests."""
+def reset_singletons(request):
+    """Reset singleton instances around tests marked resets_singletons.
+
+    Tests that only construct their own PromptManager never touch the
+    module globals, so the reset is opt-in rather than paid by every test.
+    """
+    if request.node.get_closest_marker("resets_singletons") is None:
+        yield
+        return
+
     # Reset any global state
     from prompt_manager.core.config import reset_config
     from prompt_manager.core.manager import reset_prompt_manager
-    
+
     reset_config()
     reset_prompt_manager()
-    
+
     yield
-    
+
     # Cleanup after test
     reset_config()
     reset_prompt_manager()
@@ -1,5 +1,7 @@
 """Setup configuration for python-prompt-manager."""
 
+import re
+
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -9,12 +11,10 @@ long_description = (this_directory / "README.md").read_text(encoding="utf-8")
 
 # Read version from package
 version_file = this_directory / "src" / "prompt_manager" / "__init__.py"
-version = None
-with open(version_file, "r", encoding="utf-8") as f:
-    for line in f:
-        if line.startswith("__version__"):
-            version = line.split('"')[1]
-            break
+match = re.search(
+    r'^__version__\s*=\s*"([^"]+)"', version_file.read_text(encoding="utf-8"), re.M
+)
+version = match.group(1) if match else None
 
 if not version:
     raise RuntimeError("Cannot find version information")
@@ -62,6 +62,9 @@ setup(
         "yaml": ["pyyaml>=5.4"],
         "django": ["django>=3.2"],
         "pydantic": ["pydantic>=2.0"],
+        "orjson": ["orjson>=3.8"],
+        "watch": ["watchdog>=2.1"],
+        "ijson": ["ijson>=3.1"],
         "all": ["openai>=1.0.0", "pyyaml>=5.4", "pydantic>=2.0"],
         "dev": [
             "pytest>=7.0",
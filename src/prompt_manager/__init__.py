@@ -13,67 +13,57 @@ Basic usage:
     prompt = get_prompt("greeting", variables={"name": "Alice"})
 """
 
+from importlib import import_module
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .core.config import (
-    PromptConfig,
-    PromptManagerConfig,
-    SourceType,
-    ValidationMode,
-    get_config,
-    reset_config,
-)
-
-# Exception imports
-from .core.exceptions import (
-    ConfigurationError,
-    PromptError,
-    PromptManagerError,
-    PromptNotFoundError,
-    PromptNotRegisteredError,
-    PromptRetrievalError,
-    SourceError,
-    ValidationError,
-)
-
-# Core imports
-from .core.manager import (
-    PromptManager,
-    get_prompt,
-    get_prompt_manager,
-    reset_prompt_manager,
-)
-from .core.registry import PromptRegistry
-
-# Source imports
-from .sources.base import BasePromptSource
-
-__all__ = [
+# Public names mapped to their defining submodule. Attributes are resolved
+# lazily (PEP 562) so `import prompt_manager` doesn't pay for Pydantic and
+# the source adapters until something is actually used.
+_EXPORTS = {
     # Core functionality
-    "PromptManager",
-    "get_prompt_manager",
-    "reset_prompt_manager",
-    "get_prompt",
+    "PromptManager": ".core.manager",
+    "get_prompt_manager": ".core.manager",
+    "reset_prompt_manager": ".core.manager",
+    "get_prompt": ".core.manager",
     # Configuration
-    "PromptConfig",
-    "PromptManagerConfig",
-    "SourceType",
-    "ValidationMode",
-    "get_config",
-    "reset_config",
+    "PromptConfig": ".core.config",
+    "PromptManagerConfig": ".core.config",
+    "SourceType": ".core.config",
+    "ValidationMode": ".core.config",
+    "get_config": ".core.config",
+    "reset_config": ".core.config",
+    "clear_config_cache": ".core.config",
     # Registry
-    "PromptRegistry",
+    "PromptRegistry": ".core.registry",
     # Exceptions
-    "PromptManagerError",
-    "ConfigurationError",
-    "ValidationError",
-    "SourceError",
-    "PromptError",
-    "PromptNotFoundError",
-    "PromptRetrievalError",
-    "PromptNotRegisteredError",
+    "PromptManagerError": ".core.exceptions",
+    "ConfigurationError": ".core.exceptions",
+    "ValidationError": ".core.exceptions",
+    "SourceError": ".core.exceptions",
+    "PromptError": ".core.exceptions",
+    "PromptNotFoundError": ".core.exceptions",
+    "PromptRetrievalError": ".core.exceptions",
+    "PromptNotRegisteredError": ".core.exceptions",
     # Base classes
-    "BasePromptSource",
-]
+    "BasePromptSource": ".sources.base",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve public attributes lazily on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so subsequent access skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
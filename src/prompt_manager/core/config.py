@@ -6,23 +6,63 @@ and validation.
 
 import logging
 import os
+import re
+import sys
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 try:
     from pydantic import BaseModel, Field, ValidationError, field_validator
+
+    HAS_PYDANTIC = True
 except ImportError:
-    # Fallback for minimal installation
+    # Fallback for minimal installation: the model classes are rebuilt as
+    # frozen (and, on 3.10+, slotted) dataclasses right after their
+    # definitions, giving an equivalent keyword constructor without the
+    # validation machinery
+    from dataclasses import dataclass as _dataclass
+    from dataclasses import field as _dc_field
+
+    HAS_PYDANTIC = False
     BaseModel = object
-    Field = lambda *args, **kwargs: None
     ValidationError = Exception
     field_validator = lambda *args, **kwargs: lambda func: func
 
+    def Field(default=None, default_factory=None, **kwargs):
+        """Map a pydantic Field declaration onto a dataclass field."""
+        if default_factory is not None:
+            return _dc_field(default_factory=default_factory)
+        return _dc_field(default=None if default is ... else default)
+
+    _DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 from .exceptions import ConfigurationError
 from .exceptions import ValidationError as PromptValidationError
 
 logger = logging.getLogger(__name__)
 
+# Matches per-prompt environment variables (PROMPT_{NAME}_{FIELD}) while
+# rejecting PROMPT_MANAGER_* settings; one C-level match per env var beats
+# chained startswith/endswith/split in large CI environments
+_PROMPT_ENV_RE = re.compile(r"^PROMPT_(?!MANAGER_)(.+)_(SOURCE|ID|VERSION|PATH|CACHE_TTL)$")
+
+# Environment keys read on every config parse
+_DEFAULT_SOURCE_KEY = "PROMPT_MANAGER_DEFAULT_SOURCE"
+_CACHE_ENABLED_KEY = "PROMPT_MANAGER_CACHE_ENABLED"
+_CACHE_TTL_KEY = "PROMPT_MANAGER_CACHE_TTL"
+_CACHE_MAX_SIZE_KEY = "PROMPT_MANAGER_CACHE_MAX_SIZE"
+_VALIDATE_ON_STARTUP_KEY = "PROMPT_MANAGER_VALIDATE_ON_STARTUP"
+_VALIDATE_FAIL_FAST_KEY = "PROMPT_MANAGER_VALIDATE_FAIL_FAST"
+_OPENAI_API_KEY_KEY = "PROMPT_MANAGER_OPENAI_API_KEY"
+_OPENAI_TIMEOUT_KEY = "PROMPT_MANAGER_OPENAI_TIMEOUT"
+_OPENAI_MAX_RETRIES_KEY = "PROMPT_MANAGER_OPENAI_MAX_RETRIES"
+_PROMPTS_DIR_KEY = "PROMPT_MANAGER_PROMPTS_DIR"
+
+# Accepted truthy spellings for boolean settings
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
 
 class SourceType(str, Enum):
     """Supported prompt source types."""
@@ -33,13 +73,18 @@ class SourceType(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "SourceType":
         """Convert string to SourceType, case-insensitive."""
-        try:
-            return cls(value.lower())
-        except ValueError:
-            valid_types = ", ".join([t.value for t in cls])
+        member = cls._BY_VALUE.get(value.lower())
+        if member is None:
             raise ConfigurationError(
-                f"Invalid source type '{value}'. Valid types are: {valid_types}"
+                f"Invalid source type '{value}'. Valid types are: {cls._VALID_VALUES}"
             )
+        return member
+
+
+# Lookup tables so from_string is a dict hit instead of Enum.__call__'s
+# fallback chain, with the error string joined once instead of per failure
+SourceType._BY_VALUE = {m.value: m for m in SourceType}
+SourceType._VALID_VALUES = ", ".join(m.value for m in SourceType)
 
 
 class ValidationMode(str, Enum):
@@ -52,13 +97,16 @@ class ValidationMode(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "ValidationMode":
         """Convert string to ValidationMode, case-insensitive."""
-        try:
-            return cls(value.lower())
-        except ValueError:
-            valid_modes = ", ".join([m.value for m in cls])
+        member = cls._BY_VALUE.get(value.lower())
+        if member is None:
             raise ConfigurationError(
-                f"Invalid validation mode '{value}'. Valid modes are: {valid_modes}"
+                f"Invalid validation mode '{value}'. Valid modes are: {cls._VALID_VALUES}"
             )
+        return member
+
+
+ValidationMode._BY_VALUE = {m.value: m for m in ValidationMode}
+ValidationMode._VALID_VALUES = ", ".join(m.value for m in ValidationMode)
 
 
 class PromptConfig(BaseModel if BaseModel != object else object):
@@ -79,8 +127,44 @@ class PromptConfig(BaseModel if BaseModel != object else object):
             return SourceType.from_string(v)
         return v
 
+    def __post_init__(self):
+        # Dataclass-fallback counterpart of validate_source (pydantic never
+        # calls this): string sources from dict-style construction must
+        # still become enum members, object.__setattr__ because frozen
+        if isinstance(self.source, str):
+            object.__setattr__(self, "source", SourceType.from_string(self.source))
+
     @classmethod
-    def from_env(cls, name: str) -> Optional["PromptConfig"]:
+    def _from_parsed(
+        cls,
+        name: str,
+        source: Any,
+        source_config: Dict[str, Any],
+        cache_ttl: Optional[int],
+    ) -> "PromptConfig":
+        """Build a PromptConfig from already-parsed values.
+
+        Values extracted from the environment are in a known format, so
+        Pydantic's field validation is skipped via model_construct; only
+        the string-to-enum conversion is applied by hand.
+        """
+        if isinstance(source, str):
+            source = SourceType.from_string(source)
+        if hasattr(cls, "model_construct"):
+            return cls.model_construct(
+                name=name,
+                source=source,
+                source_config=source_config,
+                cache_ttl=cache_ttl,
+            )
+        return cls(
+            name=name, source=source, source_config=source_config, cache_ttl=cache_ttl
+        )
+
+    @classmethod
+    def from_env(
+        cls, name: str, env: Optional[Dict[str, str]] = None
+    ) -> Optional["PromptConfig"]:
         """Create PromptConfig from environment variables.
 
         Expected format:
@@ -89,39 +173,67 @@ class PromptConfig(BaseModel if BaseModel != object else object):
         PROMPT_{NAME}_VERSION=1
         PROMPT_{NAME}_PATH=/path/to/prompt.txt
         PROMPT_{NAME}_CACHE_TTL=3600
+
+        Args:
+            name: Prompt name to look up
+            env: Environment snapshot to read from (defaults to os.environ)
         """
-        env_prefix = f"PROMPT_{name.upper()}"
-        source = os.getenv(f"{env_prefix}_SOURCE")
+        if env is None:
+            env = os.environ
+        # Build the prefix once; plain concatenation below avoids re-running
+        # name.upper() and the f-string formatter for every key
+        env_prefix = "PROMPT_" + name.upper() + "_"
+        source = env.get(env_prefix + "SOURCE")
 
         if not source:
             return None
 
-        # Build source-specific config
-        source_config = {}
-
-        # Common fields
-        if prompt_id := os.getenv(f"{env_prefix}_ID"):
-            source_config["prompt_id"] = prompt_id
-        if version := os.getenv(f"{env_prefix}_VERSION"):
-            source_config["version"] = version
-        if path := os.getenv(f"{env_prefix}_PATH"):
-            source_config["path"] = path
-
-        # Cache TTL
-        cache_ttl = None
-        if ttl_str := os.getenv(f"{env_prefix}_CACHE_TTL"):
-            try:
-                cache_ttl = int(ttl_str)
-            except ValueError:
-                raise ConfigurationError(
-                    f"Invalid cache TTL for prompt '{name}': {ttl_str}"
-                )
-
-        return cls(
-            name=name, source=source, source_config=source_config, cache_ttl=cache_ttl
+        return _prompt_config_from_values(
+            name,
+            source,
+            env.get(env_prefix + "ID"),
+            env.get(env_prefix + "VERSION"),
+            env.get(env_prefix + "PATH"),
+            env.get(env_prefix + "CACHE_TTL"),
         )
 
 
+if not HAS_PYDANTIC:
+    PromptConfig = _dataclass(frozen=True, **_DATACLASS_OPTS)(PromptConfig)
+
+
+@lru_cache(maxsize=256)
+def _prompt_config_from_values(
+    name: str,
+    source: str,
+    prompt_id: Optional[str],
+    version: Optional[str],
+    path: Optional[str],
+    ttl_str: Optional[str],
+) -> PromptConfig:
+    """Build and memoize a PromptConfig from extracted env values.
+
+    Keyed on the immutable value tuple, so repeated config reloads with
+    an unchanged environment reuse the already-parsed object.
+    """
+    source_config = {}
+    if prompt_id:
+        source_config["prompt_id"] = prompt_id
+    if version:
+        source_config["version"] = version
+    if path:
+        source_config["path"] = path
+
+    cache_ttl = None
+    if ttl_str:
+        try:
+            cache_ttl = int(ttl_str)
+        except ValueError:
+            raise ConfigurationError(f"Invalid cache TTL for prompt '{name}': {ttl_str}")
+
+    return PromptConfig._from_parsed(name, source, source_config, cache_ttl)
+
+
 class PromptManagerConfig(BaseModel if BaseModel != object else object):
     """Main configuration for PromptManager."""
 
@@ -131,9 +243,15 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
     )
     cache_enabled: bool = Field(True, description="Enable prompt caching")
     cache_ttl: int = Field(3600, description="Default cache TTL in seconds")
+    cache_max_size: int = Field(
+        1024, description="Maximum number of cached prompts (0 means unbounded)"
+    )
     validate_on_startup: ValidationMode = Field(
         ValidationMode.ENV_ONLY, description="Validation mode on startup"
     )
+    validate_fail_fast: bool = Field(
+        False, description="Stop source validation at the first error"
+    )
 
     # Source configurations
     openai_api_key: Optional[str] = Field(None, description="OpenAI API key")
@@ -165,6 +283,21 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
             return ValidationMode.from_string(v)
         return v
 
+    def __post_init__(self):
+        # Dataclass-fallback counterpart of the before-validators above:
+        # coerce string values to enum members so downstream dispatch can
+        # rely on identity in both install modes
+        if isinstance(self.default_source, str):
+            object.__setattr__(
+                self, "default_source", SourceType.from_string(self.default_source)
+            )
+        if isinstance(self.validate_on_startup, str):
+            object.__setattr__(
+                self,
+                "validate_on_startup",
+                ValidationMode.from_string(self.validate_on_startup),
+            )
+
     @classmethod
     def from_env(cls) -> "PromptManagerConfig":
         """Create configuration from environment variables.
@@ -173,63 +306,98 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
         PROMPT_MANAGER_DEFAULT_SOURCE=openai
         PROMPT_MANAGER_CACHE_ENABLED=true
         PROMPT_MANAGER_CACHE_TTL=3600
+        PROMPT_MANAGER_CACHE_MAX_SIZE=1024
         PROMPT_MANAGER_VALIDATE_ON_STARTUP=env_only
         PROMPT_MANAGER_OPENAI_API_KEY=sk-...
         PROMPT_MANAGER_OPENAI_TIMEOUT=30
         PROMPT_MANAGER_OPENAI_MAX_RETRIES=3
         PROMPT_MANAGER_PROMPTS_DIR=/app/prompts
         """
-        # Parse basic settings
-        config_dict = {
-            "default_source": os.getenv("PROMPT_MANAGER_DEFAULT_SOURCE"),
-            "cache_enabled": os.getenv("PROMPT_MANAGER_CACHE_ENABLED", "true").lower()
-            == "true",
-            "cache_ttl": int(os.getenv("PROMPT_MANAGER_CACHE_TTL", "3600")),
-            "validate_on_startup": os.getenv(
-                "PROMPT_MANAGER_VALIDATE_ON_STARTUP", "env_only"
-            ),
-            "openai_api_key": os.getenv("PROMPT_MANAGER_OPENAI_API_KEY"),
-            "openai_timeout": int(os.getenv("PROMPT_MANAGER_OPENAI_TIMEOUT", "30")),
-            "openai_max_retries": int(
-                os.getenv("PROMPT_MANAGER_OPENAI_MAX_RETRIES", "3")
-            ),
-            "prompts_dir": os.getenv("PROMPT_MANAGER_PROMPTS_DIR"),
-            "prompts": {},
-        }
-
-        # Auto-discover prompts from environment
-        discovered_prompts = cls._discover_prompts_from_env()
-        config_dict["prompts"] = discovered_prompts
+        # Snapshot the environment once; every lookup below is then a plain
+        # dict hit instead of going through the os.environ wrapper
+        env = dict(os.environ)
 
         try:
-            return cls(**config_dict)
+            # Parse basic settings; everything is coerced here, so the
+            # Pydantic path can use model_construct and skip validation
+            default_source = env.get(_DEFAULT_SOURCE_KEY)
+            if default_source is not None:
+                default_source = SourceType.from_string(default_source)
+
+            build = cls.model_construct if hasattr(cls, "model_construct") else cls
+            return build(
+                default_source=default_source,
+                cache_enabled=env.get(_CACHE_ENABLED_KEY, "true").lower()
+                in _TRUE_VALUES,
+                cache_ttl=int(env.get(_CACHE_TTL_KEY, "3600")),
+                cache_max_size=int(env.get(_CACHE_MAX_SIZE_KEY, "1024")),
+                validate_on_startup=ValidationMode.from_string(
+                    env.get(_VALIDATE_ON_STARTUP_KEY, "env_only")
+                ),
+                validate_fail_fast=env.get(_VALIDATE_FAIL_FAST_KEY, "false").lower()
+                in _TRUE_VALUES,
+                openai_api_key=env.get(_OPENAI_API_KEY_KEY),
+                openai_timeout=int(env.get(_OPENAI_TIMEOUT_KEY, "30")),
+                openai_max_retries=int(env.get(_OPENAI_MAX_RETRIES_KEY, "3")),
+                prompts_dir=env.get(_PROMPTS_DIR_KEY),
+                prompts=cls._discover_prompts_from_env(env),
+            )
         except (ValidationError, ValueError) as e:
             raise ConfigurationError(f"Invalid configuration: {str(e)}")
 
     @staticmethod
-    def _discover_prompts_from_env() -> Dict[str, PromptConfig]:
-        """Discover prompt configurations from environment variables."""
+    def _discover_prompts_from_env(
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, PromptConfig]:
+        """Discover prompt configurations from environment variables.
+
+        Scans the environment once, bucketing all PROMPT_* variables by
+        prompt name, then builds the PromptConfig objects directly from
+        the buckets without further os.getenv lookups.
+
+        Args:
+            env: Environment snapshot to scan (defaults to os.environ)
+        """
+        if env is None:
+            env = os.environ
+        buckets: Dict[str, Dict[str, str]] = defaultdict(dict)
+
+        for key, value in env.items():
+            # Cheap C-level prefix check first; the regex only runs for the
+            # handful of PROMPT_* keys, not every unrelated variable
+            if not key.startswith("PROMPT_"):
+                continue
+            if match := _PROMPT_ENV_RE.match(key):
+                name, field = match.groups()
+                buckets[name.lower()][field.lower()] = value
+
         prompts = {}
-        seen_names: Set[str] = set()
-
-        # Look for PROMPT_*_SOURCE variables
-        for key in os.environ:
-            if key.startswith("PROMPT_") and key.endswith("_SOURCE"):
-                # Extract prompt name
-                parts = key.split("_")
-                if len(parts) >= 3:  # PROMPT_NAME_SOURCE
-                    name = "_".join(parts[1:-1]).lower()
-                    if name not in seen_names:
-                        seen_names.add(name)
-                        if config := PromptConfig.from_env(name):
-                            prompts[name] = config
-                            logger.debug(f"Discovered prompt '{name}' from environment")
+        for name, values in buckets.items():
+            # Missing or empty PROMPT_X_SOURCE doesn't define a prompt,
+            # matching the `if not source` check in PromptConfig.from_env
+            if not values.get("source"):
+                continue
+
+            prompts[name] = _prompt_config_from_values(
+                name,
+                values["source"],
+                values.get("id"),
+                values.get("version"),
+                values.get("path"),
+                values.get("cache_ttl"),
+            )
+            logger.debug(f"Discovered prompt '{name}' from environment")
 
         return prompts
 
-    def validate_sources(self) -> List[str]:
+    def validate_sources(self, stop_at_first_error: bool = False) -> List[str]:
         """Validate that required source configurations are present.
 
+        Args:
+            stop_at_first_error: Return as soon as one error is found
+                instead of scanning every prompt; useful for callers that
+                only gate on whether the configuration is valid
+
         Returns:
             List of validation errors (empty if valid)
         """
@@ -244,30 +412,63 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
                 "No prompt sources configured. Set either PROMPT_MANAGER_OPENAI_API_KEY "
                 "or PROMPT_MANAGER_PROMPTS_DIR environment variables."
             )
+            if stop_at_first_error:
+                return errors
+
+        # Bucket failing prompts in one pass; error strings are only built
+        # for checks that actually failed, and once per check rather than
+        # once per prompt
+        openai_without_key: List[str] = []
+        openai_without_id: List[str] = []
+        local_without_dir: List[str] = []
+        local_without_path: List[str] = []
 
-        # Validate each prompt has required config
         for name, prompt_config in self.prompts.items():
-            if prompt_config.source == SourceType.OPENAI:
+            if prompt_config.source is SourceType.OPENAI:
                 if not has_openai:
-                    errors.append(
-                        f"Prompt '{name}' uses OpenAI source but PROMPT_MANAGER_OPENAI_API_KEY is not set"
-                    )
+                    openai_without_key.append(name)
                 if "prompt_id" not in prompt_config.source_config:
-                    errors.append(
-                        f"Prompt '{name}' uses OpenAI source but no prompt ID configured. "
-                        f"Set PROMPT_{name.upper()}_ID environment variable."
-                    )
+                    openai_without_id.append(name)
 
-            elif prompt_config.source == SourceType.LOCAL:
+            elif prompt_config.source is SourceType.LOCAL:
                 if not has_local:
-                    errors.append(
-                        f"Prompt '{name}' uses local source but PROMPT_MANAGER_PROMPTS_DIR is not set"
-                    )
+                    local_without_dir.append(name)
                 if "path" not in prompt_config.source_config:
-                    errors.append(
-                        f"Prompt '{name}' uses local source but no path configured. "
-                        f"Set PROMPT_{name.upper()}_PATH environment variable."
-                    )
+                    local_without_path.append(name)
+
+            if stop_at_first_error and (
+                openai_without_key
+                or openai_without_id
+                or local_without_dir
+                or local_without_path
+            ):
+                break
+
+        def _join(names: List[str]) -> str:
+            return ", ".join(f"'{n}'" for n in names)
+
+        if openai_without_key:
+            errors.append(
+                f"Prompt(s) {_join(openai_without_key)} use OpenAI source "
+                "but PROMPT_MANAGER_OPENAI_API_KEY is not set"
+            )
+        if openai_without_id:
+            errors.append(
+                f"Prompt(s) {_join(openai_without_id)} use OpenAI source "
+                "but no prompt ID configured. Set the corresponding "
+                "PROMPT_{NAME}_ID environment variables."
+            )
+        if local_without_dir:
+            errors.append(
+                f"Prompt(s) {_join(local_without_dir)} use local source "
+                "but PROMPT_MANAGER_PROMPTS_DIR is not set"
+            )
+        if local_without_path:
+            errors.append(
+                f"Prompt(s) {_join(local_without_path)} use local source "
+                "but no path configured. Set the corresponding "
+                "PROMPT_{NAME}_PATH environment variables."
+            )
 
         return errors
 
@@ -282,11 +483,12 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
         """
         mode = mode or self.validate_on_startup
 
-        if mode == ValidationMode.NONE:
+        if mode is ValidationMode.NONE:
             return
 
-        # Always validate source configuration
-        errors = self.validate_sources()
+        # Always validate source configuration; when fail-fast is enabled
+        # the raised error reports only the first problem found
+        errors = self.validate_sources(stop_at_first_error=self.validate_fail_fast)
 
         if errors:
             raise PromptValidationError(
@@ -297,19 +499,58 @@ class PromptManagerConfig(BaseModel if BaseModel != object else object):
         logger.info(f"Configuration validated successfully (mode: {mode.value})")
 
 
+if not HAS_PYDANTIC:
+    PromptManagerConfig = _dataclass(frozen=True, **_DATACLASS_OPTS)(
+        PromptManagerConfig
+    )
+
+
 # Global configuration instance
 _config: Optional[PromptManagerConfig] = None
 
+# Parsed configurations keyed by a hash of the relevant environment variables.
+# Re-parsing the environment is the expensive part of get_config(), so results
+# are memoized and only invalidated when the PROMPT_* values actually change.
+_config_cache: Dict[int, PromptManagerConfig] = {}
+
+
+def _env_cache_key() -> int:
+    """Compute a cache key from the PROMPT_* environment variables."""
+    return hash(
+        tuple(
+            sorted((k, v) for k, v in os.environ.items() if k.startswith("PROMPT_"))
+        )
+    )
+
 
 def get_config() -> PromptManagerConfig:
-    """Get the global configuration instance, creating it if needed."""
+    """Get the global configuration instance, creating it if needed.
+
+    Parsed configurations are memoized on the relevant environment values,
+    so after reset_config() the environment is only re-parsed if it changed.
+    """
     global _config
     if _config is None:
-        _config = PromptManagerConfig.from_env()
+        key = _env_cache_key()
+        cached = _config_cache.get(key)
+        if cached is None:
+            cached = _config_cache[key] = PromptManagerConfig.from_env()
+        _config = cached
     return _config
 
 
 def reset_config() -> None:
-    """Reset the global configuration (useful for testing)."""
+    """Reset the global configuration (useful for testing).
+
+    Memoized parse results are kept; use clear_config_cache() to also
+    drop those and force a full re-parse of the environment.
+    """
     global _config
     _config = None
+
+
+def clear_config_cache() -> None:
+    """Reset the global configuration and drop all memoized parse results."""
+    _config_cache.clear()
+    _prompt_config_from_values.cache_clear()
+    reset_config()
@@ -8,48 +8,50 @@ following a clear hierarchy for better error handling and debugging.
 class PromptManagerError(Exception):
     """Base exception for all prompt manager errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(PromptManagerError):
     """Raised when configuration is invalid or missing."""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(PromptManagerError):
     """Raised when validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class SourceError(PromptManagerError):
     """Base exception for prompt source errors."""
 
-    pass
+    __slots__ = ()
 
 
 class SourceNotFoundError(SourceError):
     """Raised when a prompt source is not found or misconfigured."""
 
-    pass
+    __slots__ = ()
 
 
 class SourceConnectionError(SourceError):
     """Raised when unable to connect to a prompt source."""
 
-    pass
+    __slots__ = ()
 
 
 class PromptError(PromptManagerError):
     """Base exception for prompt-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class PromptNotFoundError(PromptError):
     """Raised when a prompt cannot be found."""
 
+    __slots__ = ("prompt_name", "source")
+
     def __init__(self, prompt_name: str, source: str = None, details: str = None):
         self.prompt_name = prompt_name
         self.source = source
@@ -64,6 +66,8 @@ class PromptNotFoundError(PromptError):
 class PromptRetrievalError(PromptError):
     """Raised when prompt retrieval fails."""
 
+    __slots__ = ("prompt_name", "source", "original_error")
+
     def __init__(self, prompt_name: str, source: str, original_error: Exception):
         self.prompt_name = prompt_name
         self.source = source
@@ -75,12 +79,14 @@ class PromptRetrievalError(PromptError):
 class RegistryError(PromptManagerError):
     """Base exception for registry-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class PromptAlreadyRegisteredError(RegistryError):
     """Raised when attempting to register a prompt that already exists."""
 
+    __slots__ = ("prompt_name",)
+
     def __init__(self, prompt_name: str):
         self.prompt_name = prompt_name
         super().__init__(f"Prompt '{prompt_name}' is already registered")
@@ -89,6 +95,8 @@ class PromptAlreadyRegisteredError(RegistryError):
 class PromptNotRegisteredError(RegistryError):
     """Raised when attempting to access an unregistered prompt."""
 
+    __slots__ = ("prompt_name",)
+
     def __init__(self, prompt_name: str):
         self.prompt_name = prompt_name
         super().__init__(f"Prompt '{prompt_name}' is not registered")
@@ -98,37 +106,39 @@ class PromptNotRegisteredError(RegistryError):
 class OpenAIError(SourceError):
     """Base exception for OpenAI-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class OpenAIConfigError(OpenAIError, ConfigurationError):
     """Raised when OpenAI configuration is invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class OpenAIRateLimitError(OpenAIError):
     """Raised when OpenAI rate limit is exceeded."""
 
-    pass
+    __slots__ = ()
 
 
 class OpenAITimeoutError(OpenAIError):
     """Raised when OpenAI request times out."""
 
-    pass
+    __slots__ = ()
 
 
 # Local file source exceptions
 class LocalSourceError(SourceError):
     """Base exception for local file source errors."""
 
-    pass
+    __slots__ = ()
 
 
 class FileNotFoundError(LocalSourceError):
     """Raised when a prompt file is not found."""
 
+    __slots__ = ("file_path",)
+
     def __init__(self, file_path: str):
         self.file_path = file_path
         super().__init__(f"Prompt file not found: {file_path}")
@@ -137,6 +147,8 @@ class FileNotFoundError(LocalSourceError):
 class FileReadError(LocalSourceError):
     """Raised when unable to read a prompt file."""
 
+    __slots__ = ("file_path", "original_error")
+
     def __init__(self, file_path: str, original_error: Exception):
         self.file_path = file_path
         self.original_error = original_error
@@ -6,7 +6,8 @@ prompt retrieval from various sources with caching and validation.
 
 import logging
 import time
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
 from threading import RLock
 from typing import Any, Dict, Optional, Type, Union
 
@@ -32,6 +33,15 @@ from .registry import PromptRegistry
 
 logger = logging.getLogger(__name__)
 
+# Schema-level constants for dict-style configuration decoding, hoisted so
+# _create_config_from_dict doesn't rebuild them per call. Plain module
+# constants are also safe on free-threaded builds, unlike functools.lru_cache.
+# One table covers both the boolean shorthand and the mode value strings,
+# so decoding is a single dict hit instead of an isinstance/string ladder
+_VALIDATE_MAP = {True: ValidationMode.LOAD_TEST, False: ValidationMode.NONE}
+_VALIDATE_MAP.update({m.value: m for m in ValidationMode})
+_PROMPT_DICT_KEYS = ("version", "path")
+
 
 class PromptManager:
     """Main class for managing prompts from various sources.
@@ -46,12 +56,29 @@ class PromptManager:
         >>> prompt_with_vars = pm.get_prompt("greeting", variables={"name": "Alice"})
     """
 
+    __slots__ = (
+        "config",
+        "registry",
+        "_sources",
+        "_cache_shards",
+        "_cache_locks",
+        "_shard_limit",
+        "_lock",
+        "_specialized",
+        "_source_config_cache",
+        "_format_cache",
+    )
+
     # Source type to class mapping
     SOURCE_CLASSES: Dict[SourceType, Type[BasePromptSource]] = {
         SourceType.OPENAI: OpenAIPromptSource,
         SourceType.LOCAL: LocalFileSource,
     }
 
+    # Number of independent cache shards; power of two so the shard index
+    # is a cheap mask of the key hash
+    CACHE_SHARDS = 16
+
     def __init__(
         self, config: Optional[Union[Dict[str, Any], PromptManagerConfig]] = None
     ):
@@ -69,14 +96,29 @@ class PromptManager:
 
         self.registry = PromptRegistry()
         self._sources: Dict[SourceType, BasePromptSource] = {}
-        self._cache: Dict[str, tuple[str, float]] = {}  # (content, timestamp)
+        # Sharded cache: threads touching different keys lock different
+        # shards instead of serializing on one mutex
+        self._cache_shards: list = [{} for _ in range(self.CACHE_SHARDS)]
+        self._cache_locks: list = [RLock() for _ in range(self.CACHE_SHARDS)]
+        # Per-shard entry budget derived from cache_max_size (0 = unbounded)
+        max_size = self.config.cache_max_size or 0
+        self._shard_limit = (
+            max(1, max_size // self.CACHE_SHARDS) if max_size > 0 else 0
+        )
         self._lock = RLock()
+        # Per-prompt specialized retrieval closures and per-source config
+        # dicts, built once instead of per retrieval
+        self._specialized: Dict[str, tuple] = {}
+        self._source_config_cache: Dict[SourceType, Dict[str, Any]] = {}
+        # Parsed format-string tokens per template; None marks templates
+        # that need full str.format (attribute access, nested specs, ...)
+        self._format_cache: Dict[str, Optional[list]] = {}
 
         # Register prompts from config
         self._register_configured_prompts()
 
         # Validate on startup if configured
-        if self.config.validate_on_startup != ValidationMode.NONE:
+        if self.config.validate_on_startup is not ValidationMode.NONE:
             self.validate(self.config.validate_on_startup)
 
     def _create_config_from_dict(
@@ -106,7 +148,7 @@ class PromptManager:
                 source_config["prompt_id"] = prompt_dict["id"]
 
             # Add other fields to source_config
-            for key in ["version", "path"]:
+            for key in _PROMPT_DICT_KEYS:
                 if key in prompt_dict:
                     source_config[key] = prompt_dict[key]
 
@@ -117,12 +159,16 @@ class PromptManager:
                 cache_ttl=prompt_dict.get("cache_ttl"),
             )
 
-        # Handle validate_on_startup - convert boolean to ValidationMode
-        validate_on_startup = config_dict.get("validate_on_startup", "env_only")
-        if isinstance(validate_on_startup, bool):
-            validate_on_startup = (
-                ValidationMode.LOAD_TEST if validate_on_startup else ValidationMode.NONE
-            )
+        # Handle validate_on_startup - booleans and mode strings resolve
+        # through one table; unknown values fall through so the config
+        # model raises its usual error
+        raw_validate = config_dict.get("validate_on_startup", "env_only")
+        map_key = (
+            raw_validate
+            if isinstance(raw_validate, bool)
+            else str(raw_validate).lower()
+        )
+        validate_on_startup = _VALIDATE_MAP.get(map_key, raw_validate)
 
         # Create the config
         return PromptManagerConfig(
@@ -132,20 +178,23 @@ class PromptManager:
             openai_max_retries=openai_config.get("max_retries", 3),
             prompts_dir=local_config.get("base_dir"),
             cache_ttl=config_dict.get("cache_ttl", 3600),
+            cache_max_size=config_dict.get("cache_max_size", 1024),
             cache_enabled=config_dict.get("cache_enabled", True),
             validate_on_startup=validate_on_startup,
+            validate_fail_fast=config_dict.get("validate_fail_fast", False),
             default_source=config_dict.get("default_source"),
         )
 
     def _register_configured_prompts(self) -> None:
         """Register prompts from configuration."""
-        for name, prompt_config in self.config.prompts.items():
-            self.registry.register(prompt_config)
+        if not self.config.prompts:
+            return
 
-        if self.config.prompts:
-            logger.info(
-                f"Registered {len(self.config.prompts)} prompts from configuration"
-            )
+        # One lock acquisition and one snapshot rebuild for the whole batch
+        self.registry.register_many(self.config.prompts.values())
+        logger.info(
+            "Registered %d prompts from configuration", len(self.config.prompts)
+        )
 
     def get_prompt(
         self,
@@ -172,8 +221,9 @@ class PromptManager:
             PromptRetrievalError: If retrieval fails
         """
         try:
-            # Check cache first
-            cache_key = f"{name}:{version or 'latest'}"
+            # Check cache first; a (name, version) tuple avoids the string
+            # build and hashes in C, with None standing for "latest"
+            cache_key = (name, version)
             cached_content = self._get_cached(cache_key)
             if cached_content is not None:
                 return self._apply_variables(cached_content, variables)
@@ -186,19 +236,27 @@ class PromptManager:
                     return self._apply_variables(default, variables)
                 raise
 
-            # Get the source
+            # Common case (no overrides): dispatch to the retrieval
+            # closure specialized for this prompt on first use, which has
+            # the source, prompt id, params and TTL already bound
+            if not (version or variables or kwargs):
+                entry = self._specialized.get(name)
+                if entry is None or entry[0] is not prompt_config:
+                    entry = (prompt_config, self._specialize(name, prompt_config))
+                    self._specialized[name] = entry
+                return entry[1]()
+
+            # Override path: build the retrieval params for this call
             source = self._get_source(prompt_config.source)
-
-            # Prepare retrieval parameters
             retrieval_params = prompt_config.source_config.copy()
             if version:
                 retrieval_params["version"] = version
             if variables:
                 retrieval_params["variables"] = variables
             retrieval_params.update(kwargs)
+            prompt_id = retrieval_params.pop("prompt_id", name)
 
             # Retrieve the prompt
-            prompt_id = retrieval_params.pop("prompt_id", name)
             content = source.get_prompt(prompt_id, **retrieval_params)
 
             # Cache the result
@@ -209,12 +267,39 @@ class PromptManager:
             return self._apply_variables(content, variables)
 
         except Exception as e:
-            logger.error(f"Failed to get prompt '{name}': {e}")
+            logger.error("Failed to get prompt '%s': %s", name, e)
             if default is not None:
-                logger.info(f"Using default value for prompt '{name}'")
+                logger.info("Using default value for prompt '%s'", name)
                 return self._apply_variables(default, variables)
             raise
 
+    def get_prompt_batch(
+        self,
+        name: str,
+        variables_list: "list[Dict[str, Any]]",
+        version: Optional[str] = None,
+        **kwargs,
+    ) -> "list[str]":
+        """Render one prompt against many variable dicts.
+
+        The prompt is retrieved once and its template parsed once, so
+        batched pipelines pay the per-call lookup and parse overhead a
+        single time instead of per render.
+
+        Args:
+            name: The prompt name/identifier
+            variables_list: One dict of variables per desired rendering
+            version: Optional version specifier
+            **kwargs: Additional parameters passed to get_prompt
+
+        Returns:
+            Rendered prompts in the same order as variables_list
+        """
+        content = self.get_prompt(name, version=version, **kwargs)
+        return [
+            self._apply_variables(content, variables) for variables in variables_list
+        ]
+
     def get(self, name: str, **kwargs) -> str:
         """Alias for get_prompt() to match the simpler API shown in examples.
 
@@ -255,7 +340,7 @@ class PromptManager:
             cache_ttl=cache_ttl,
             overwrite=overwrite,
         )
-        logger.info(f"Registered prompt '{name}' with source '{source}'")
+        logger.info("Registered prompt '%s' with source '%s'", name, source)
 
     def validate(self, mode: Optional[ValidationMode] = None) -> None:
         """Validate prompt manager configuration and prompts.
@@ -282,16 +367,23 @@ class PromptManager:
             )
 
         # If load test mode, try to load all prompts
-        if mode == ValidationMode.LOAD_TEST:
+        if mode is ValidationMode.LOAD_TEST:
             self._validate_prompt_loading()
 
         logger.info("Validation completed successfully")
 
     def _validate_prompt_loading(self) -> None:
-        """Validate that all registered prompts can be loaded."""
-        errors = []
+        """Validate that all registered prompts can be loaded.
+
+        Each check is independent (and network-bound for OpenAI), so they
+        run concurrently; startup cost is one round-trip instead of one
+        per prompt. All errors are still collected and surfaced together.
+        """
+        names = self.registry.list_prompts()
+        if not names:
+            return
 
-        for name in self.registry.list_prompts():
+        def _validate_one(name: str) -> Optional[str]:
             try:
                 prompt_config = self.registry.get(name)
                 source = self._get_source(prompt_config.source)
@@ -301,12 +393,17 @@ class PromptManager:
                 version = prompt_config.source_config.get("version")
 
                 if not source.validate_prompt_exists(prompt_id, version):
-                    errors.append(
-                        f"Prompt '{name}' not found in {prompt_config.source.value} source"
+                    return (
+                        f"Prompt '{name}' not found in "
+                        f"{prompt_config.source.value} source"
                     )
 
             except Exception as e:
-                errors.append(f"Failed to validate prompt '{name}': {str(e)}")
+                return f"Failed to validate prompt '{name}': {str(e)}"
+            return None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+            errors = [e for e in executor.map(_validate_one, names) if e is not None]
 
         if errors:
             raise ValidationError(
@@ -314,6 +411,31 @@ class PromptManager:
                 + "\n".join(f"  - {e}" for e in errors)
             )
 
+    def _specialize(self, name: str, prompt_config: PromptConfig):
+        """Build a retrieval closure specialized for one prompt.
+
+        Everything that is fixed for the prompt's configuration — the
+        source instance, prompt id, retrieval params and effective TTL —
+        is resolved once here, so the hot no-override path of get_prompt
+        skips the per-call branching and dict copies entirely. The closure
+        is rebuilt whenever the registered config object changes.
+        """
+        source = self._get_source(prompt_config.source)
+        source_config = prompt_config.source_config
+        prompt_id = source_config.get("prompt_id", name)
+        params = {k: v for k, v in source_config.items() if k != "prompt_id"}
+        cache_enabled = self.config.cache_enabled
+        ttl = prompt_config.cache_ttl or self.config.cache_ttl
+        cache_key = (name, None)
+
+        def _fetch() -> str:
+            content = source.get_prompt(prompt_id, **params)
+            if cache_enabled:
+                self._cache_prompt(cache_key, content, ttl)
+            return content
+
+        return _fetch
+
     def _get_source(self, source_type: SourceType) -> BasePromptSource:
         """Get or create a source instance.
 
@@ -327,8 +449,15 @@ class PromptManager:
             SourceNotFoundError: If source type not supported
             SourceConnectionError: If source initialization fails
         """
+        # Double-checked locking: sources are created once and never
+        # removed, so after warm-up this is a single lock-free dict read
+        source = self._sources.get(source_type)
+        if source is not None:
+            return source
+
         with self._lock:
-            if source_type not in self._sources:
+            source = self._sources.get(source_type)
+            if source is None:
                 # Get source class
                 source_class = self.SOURCE_CLASSES.get(source_type)
                 if not source_class:
@@ -343,9 +472,9 @@ class PromptManager:
                 source = source_class(source_config)
                 self._sources[source_type] = source
 
-                logger.debug(f"Created {source_type.value} source")
+                logger.debug("Created %s source", source_type.value)
 
-            return self._sources[source_type]
+            return source
 
     def _get_source_config(self, source_type: SourceType) -> Dict[str, Any]:
         """Get configuration for a specific source type.
@@ -356,22 +485,29 @@ class PromptManager:
         Returns:
             Source-specific configuration dictionary
         """
-        if source_type == SourceType.OPENAI:
-            return {
+        config = self._source_config_cache.get(source_type)
+        if config is not None:
+            return config
+
+        if source_type is SourceType.OPENAI:
+            config = {
                 "api_key": self.config.openai_api_key,
                 "timeout": self.config.openai_timeout,
                 "max_retries": self.config.openai_max_retries,
             }
-        elif source_type == SourceType.LOCAL:
-            return {
+        elif source_type is SourceType.LOCAL:
+            config = {
                 "base_dir": self.config.prompts_dir,
                 "encoding": "utf-8",
                 "auto_reload": False,  # Could be configurable
             }
         else:
-            return {}
+            config = {}
+
+        self._source_config_cache[source_type] = config
+        return config
 
-    def _get_cached(self, cache_key: str) -> Optional[str]:
+    def _get_cached(self, cache_key: "tuple[str, Optional[str]]") -> Optional[str]:
         """Get prompt from cache if valid.
 
         Args:
@@ -383,22 +519,29 @@ class PromptManager:
         if not self.config.cache_enabled:
             return None
 
-        with self._lock:
-            if cache_key in self._cache:
-                content, timestamp = self._cache[cache_key]
-
-                # Check if expired (0 means no expiry)
-                if self.config.cache_ttl > 0:
-                    if time.time() - timestamp > self.config.cache_ttl:
-                        del self._cache[cache_key]
-                        return None
+        # Lock-free fast path: a single dict read is atomic under the GIL,
+        # so the shard lock is only needed to evict an expired entry
+        idx = hash(cache_key) & (self.CACHE_SHARDS - 1)
+        shard = self._cache_shards[idx]
+        entry = shard.get(cache_key)
+        if entry is None:
+            return None
 
-                logger.debug(f"Cache hit for {cache_key}")
-                return content
+        # Expiry is absolute (computed at write time from the effective
+        # TTL), so the read path is a single compare
+        content, expires_at = entry
+        if time.monotonic() > expires_at:
+            with self._cache_locks[idx]:
+                shard.pop(cache_key, None)
+            return None
 
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache hit for %s", cache_key)
+        return content
 
-    def _cache_prompt(self, cache_key: str, content: str, ttl: int) -> None:
+    def _cache_prompt(
+        self, cache_key: "tuple[str, Optional[str]]", content: str, ttl: int
+    ) -> None:
         """Cache a prompt.
 
         Args:
@@ -409,9 +552,20 @@ class PromptManager:
         if not self.config.cache_enabled or ttl == 0:
             return
 
-        with self._lock:
-            self._cache[cache_key] = (content, time.time())
-            logger.debug(f"Cached prompt {cache_key} with TTL {ttl}s")
+        idx = hash(cache_key) & (self.CACHE_SHARDS - 1)
+        with self._cache_locks[idx]:
+            shard = self._cache_shards[idx]
+            if (
+                self._shard_limit
+                and cache_key not in shard
+                and len(shard) >= self._shard_limit
+            ):
+                # Evict the oldest entry (insertion order). Recency is not
+                # tracked on reads so the lock-free read path stays intact.
+                shard.pop(next(iter(shard)))
+            shard[cache_key] = (content, time.monotonic() + ttl)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cached prompt %s with TTL %ss", cache_key, ttl)
 
     def _apply_variables(
         self, content: str, variables: Optional[Dict[str, Any]]
@@ -428,23 +582,65 @@ class PromptManager:
         if not variables:
             return content
 
+        tokens = self._format_cache.get(content, False)
+        if tokens is False:
+            tokens = self._parse_template(content)
+            self._format_cache[content] = tokens
+
+        if tokens is None:
+            # Complex template: defer to str.format, which re-parses
+            try:
+                return content.format(**variables)
+            except KeyError as e:
+                logger.warning(f"Missing variable for substitution: {e}")
+                return content
+
+        parts = []
         try:
-            return content.format(**variables)
+            for literal, field in tokens:
+                if literal:
+                    parts.append(literal)
+                if field is not None:
+                    parts.append(str(variables[field]))
+            return "".join(parts)
         except KeyError as e:
             logger.warning(f"Missing variable for substitution: {e}")
             return content
 
+    @staticmethod
+    def _parse_template(content: str) -> Optional[list]:
+        """Parse a template into (literal, field) tokens.
+
+        Returns None when the template uses features beyond plain named
+        placeholders (conversions, format specs, attribute/index access),
+        in which case rendering falls back to str.format.
+        """
+        try:
+            tokens = []
+            for literal, field, spec, conversion in Formatter().parse(content):
+                if conversion or spec:
+                    return None
+                if field is not None and (
+                    not field or "." in field or "[" in field
+                ):
+                    return None
+                tokens.append((literal, field))
+            return tokens
+        except ValueError:
+            return None
+
     def clear_cache(self) -> None:
         """Clear all cached prompts."""
-        with self._lock:
-            self._cache.clear()
-            logger.info("Cleared prompt cache")
+        for lock, shard in zip(self._cache_locks, self._cache_shards):
+            with lock:
+                shard.clear()
+        logger.info("Cleared prompt cache")
 
-    def list_prompts(self) -> list[str]:
-        """Get list of all registered prompt names.
+    def list_prompts(self) -> "tuple[str, ...]":
+        """Get all registered prompt names.
 
         Returns:
-            List of prompt names
+            Tuple of prompt names (the registry's published snapshot)
         """
         return self.registry.list_prompts()
 
@@ -5,8 +5,10 @@ including registration, retrieval, and validation.
 """
 
 import logging
+from collections import Counter
 from threading import RLock
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from .config import PromptConfig, SourceType
 from .exceptions import (
@@ -22,13 +24,33 @@ class PromptRegistry:
     """Registry for managing prompt configurations.
 
     Thread-safe registry for storing and retrieving prompt configurations.
+    Writes are serialized behind a lock and publish a fresh dict each time
+    (copy-on-write), so the read-heavy paths (get, exists, list) never need
+    to acquire a lock — they read the latest published snapshot, which is an
+    atomic attribute load on CPython.
     """
 
+    __slots__ = (
+        "_prompts",
+        "_lock",
+        "_source_refcounts",
+        "_sources_in_use",
+        "_view",
+        "_names",
+    )
+
     def __init__(self):
         """Initialize the registry."""
         self._prompts: Dict[str, PromptConfig] = {}
-        self._lock = RLock()
-        self._sources_in_use: Set[SourceType] = set()
+        self._lock = RLock()  # Serializes writers only
+        # Ref-counted by writers so removal is O(1); the frozenset is the
+        # published snapshot read without the lock
+        self._source_refcounts: Counter = Counter()
+        self._sources_in_use: FrozenSet[SourceType] = frozenset()
+        # Immutable views rebuilt by writers so the bulk getters are O(1)
+        # reference hand-outs instead of per-call copies
+        self._view: Mapping[str, PromptConfig] = MappingProxyType(self._prompts)
+        self._names: Tuple[str, ...] = ()
 
     def register(self, prompt_config: PromptConfig, overwrite: bool = False) -> None:
         """Register a prompt configuration.
@@ -44,14 +66,62 @@ class PromptRegistry:
             if prompt_config.name in self._prompts and not overwrite:
                 raise PromptAlreadyRegisteredError(prompt_config.name)
 
-            self._prompts[prompt_config.name] = prompt_config
-            self._sources_in_use.add(prompt_config.source)
+            overwritten = self._prompts.get(prompt_config.name)
+
+            # Copy-on-write: never mutate the published dict in place
+            prompts = dict(self._prompts)
+            prompts[prompt_config.name] = prompt_config
+
+            if overwritten is not None:
+                self._drop_source_ref(overwritten.source)
+            self._source_refcounts[prompt_config.source] += 1
+            self._publish(prompts)
 
             logger.debug(
-                f"Registered prompt '{prompt_config.name}' "
-                f"with source '{prompt_config.source.value}'"
+                "Registered prompt '%s' with source '%s'",
+                prompt_config.name,
+                prompt_config.source.value,
             )
 
+    def register_many(
+        self, configs: Iterable[PromptConfig], overwrite: bool = False
+    ) -> None:
+        """Register several prompt configurations in one lock acquisition.
+
+        Amortizes the lock round-trip and snapshot rebuild across the
+        batch instead of paying them per prompt. Nothing is published if
+        any entry fails, so a mid-batch error leaves the registry as it
+        was.
+
+        Args:
+            configs: The prompt configurations to register
+            overwrite: Whether to overwrite existing registrations
+
+        Raises:
+            PromptAlreadyRegisteredError: If a prompt exists and
+                overwrite=False
+        """
+        with self._lock:
+            prompts = dict(self._prompts)
+            refcounts = Counter(self._source_refcounts)
+            count = 0
+            for prompt_config in configs:
+                existing = prompts.get(prompt_config.name)
+                if existing is not None:
+                    if not overwrite:
+                        raise PromptAlreadyRegisteredError(prompt_config.name)
+                    refcounts[existing.source] -= 1
+                    if refcounts[existing.source] <= 0:
+                        del refcounts[existing.source]
+                prompts[prompt_config.name] = prompt_config
+                refcounts[prompt_config.source] += 1
+                count += 1
+
+            self._source_refcounts = refcounts
+            self._publish(prompts)
+
+            logger.debug("Registered %d prompts in batch", count)
+
     def register_from_dict(
         self,
         name: str,
@@ -98,10 +168,10 @@ class PromptRegistry:
         Raises:
             PromptNotRegisteredError: If prompt not found
         """
-        with self._lock:
-            if name not in self._prompts:
-                raise PromptNotRegisteredError(name)
-            return self._prompts[name]
+        config = self._prompts.get(name)
+        if config is None:
+            raise PromptNotRegisteredError(name)
+        return config
 
     def exists(self, name: str) -> bool:
         """Check if a prompt is registered.
@@ -112,26 +182,24 @@ class PromptRegistry:
         Returns:
             True if registered
         """
-        with self._lock:
-            return name in self._prompts
+        return name in self._prompts
 
-    def list_prompts(self) -> List[str]:
-        """Get list of all registered prompt names.
+    def list_prompts(self) -> Tuple[str, ...]:
+        """Get all registered prompt names.
 
         Returns:
-            List of prompt names
+            Tuple of prompt names (the published immutable snapshot)
         """
-        with self._lock:
-            return list(self._prompts.keys())
+        return self._names
 
-    def get_all(self) -> Dict[str, PromptConfig]:
+    def get_all(self) -> Mapping[str, PromptConfig]:
         """Get all registered prompt configurations.
 
         Returns:
-            Dictionary of name -> PromptConfig
+            Read-only mapping of name -> PromptConfig. This is the live
+            published snapshot, handed out without copying.
         """
-        with self._lock:
-            return self._prompts.copy()
+        return self._view
 
     def remove(self, name: str) -> None:
         """Remove a prompt from the registry.
@@ -146,32 +214,47 @@ class PromptRegistry:
             if name not in self._prompts:
                 raise PromptNotRegisteredError(name)
 
-            config = self._prompts.pop(name)
+            prompts = dict(self._prompts)
+            removed = prompts.pop(name)
 
-            # Update sources in use
-            self._update_sources_in_use()
+            # Update sources in use via the refcount: O(1) instead of a
+            # rescan of every registered prompt
+            self._drop_source_ref(removed.source)
+            self._publish(prompts)
 
-            logger.debug(f"Removed prompt '{name}' from registry")
+            logger.debug("Removed prompt '%s' from registry", name)
 
     def clear(self) -> None:
         """Clear all registered prompts."""
         with self._lock:
-            self._prompts.clear()
-            self._sources_in_use.clear()
+            self._source_refcounts = Counter()
+            self._publish({})
             logger.debug("Cleared all prompts from registry")
 
-    def get_sources_in_use(self) -> Set[SourceType]:
+    def get_sources_in_use(self) -> FrozenSet[SourceType]:
         """Get set of source types currently in use.
 
         Returns:
-            Set of SourceType values
+            Frozenset of SourceType values
         """
-        with self._lock:
-            return self._sources_in_use.copy()
+        return self._sources_in_use
+
+    def _publish(self, prompts: Dict[str, PromptConfig]) -> None:
+        """Publish a new prompts dict and its immutable views (lock held).
+
+        Rebuilding the views here keeps every reader O(1): they return a
+        reference to the current snapshot rather than copying per call.
+        """
+        self._prompts = prompts
+        self._view = MappingProxyType(prompts)
+        self._names = tuple(prompts)
+        self._sources_in_use = frozenset(self._source_refcounts)
 
-    def _update_sources_in_use(self) -> None:
-        """Update the set of sources in use."""
-        self._sources_in_use = {config.source for config in self._prompts.values()}
+    def _drop_source_ref(self, source: SourceType) -> None:
+        """Decrement a source refcount, dropping it at zero (lock held)."""
+        self._source_refcounts[source] -= 1
+        if self._source_refcounts[source] <= 0:
+            del self._source_refcounts[source]
 
     def validate_prompts(self, source_type: Optional[SourceType] = None) -> List[str]:
         """Validate registered prompts have required configuration.
@@ -184,41 +267,40 @@ class PromptRegistry:
         """
         errors = []
 
-        with self._lock:
-            for name, config in self._prompts.items():
-                # Skip if filtering by source type
-                if source_type and config.source != source_type:
-                    continue
-
-                # Source-specific validation
-                if config.source == SourceType.OPENAI:
-                    if "prompt_id" not in config.source_config:
-                        errors.append(
-                            f"Prompt '{name}': OpenAI source requires 'prompt_id' "
-                            "in source configuration"
-                        )
-
-                elif config.source == SourceType.LOCAL:
-                    # Local prompts need either a path or will use the name as path
-                    # No required fields, but we could validate path exists
-                    pass
+        for name, config in self._prompts.items():
+            # Skip if filtering by source type
+            if source_type and config.source is not source_type:
+                continue
+
+            # Source-specific validation
+            if config.source is SourceType.OPENAI:
+                if "prompt_id" not in config.source_config:
+                    errors.append(
+                        f"Prompt '{name}': OpenAI source requires 'prompt_id' "
+                        "in source configuration"
+                    )
+
+            elif config.source is SourceType.LOCAL:
+                # Local prompts need either a path or will use the name as path
+                # No required fields, but we could validate path exists
+                pass
 
         return errors
 
     def __len__(self) -> int:
         """Get number of registered prompts."""
-        with self._lock:
-            return len(self._prompts)
+        return len(self._prompts)
 
     def __contains__(self, name: str) -> bool:
         """Check if prompt is registered using 'in' operator."""
-        return self.exists(name)
+        # Inlined rather than delegating to exists(): this and the other
+        # tiny readers are dominated by call overhead, not work
+        return name in self._prompts
 
     def __repr__(self) -> str:
         """String representation of the registry."""
-        with self._lock:
-            return (
-                f"PromptRegistry("
-                f"prompts={len(self._prompts)}, "
-                f"sources={sorted(s.value for s in self._sources_in_use)})"
-            )
+        return (
+            f"PromptRegistry("
+            f"prompts={len(self._prompts)}, "
+            f"sources={sorted(s.value for s in self._sources_in_use)})"
+        )
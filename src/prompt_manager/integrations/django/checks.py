@@ -1,18 +1,38 @@
 """Django system checks for prompt manager configuration."""
 
 import os
+from pathlib import Path
 
 from django.core.checks import Error, Tags, Warning, register
 
 
+def _has_yaml_files(prompts_dir: str) -> bool:
+    """Check whether the prompt tree contains any YAML files.
+
+    rglob is a generator, so the walk stops at the first match instead
+    of scanning the whole tree. Deliberately not memoized: the top-level
+    directory mtime doesn't change when files appear in subdirectories,
+    so any cheap cache key could pin a stale answer for the process
+    lifetime.
+    """
+    return any(
+        path.suffix in (".yaml", ".yml")
+        for path in Path(prompts_dir).rglob("*.y*ml")
+    )
+
+
 @register(Tags.compatibility)
 def check_prompt_manager_configuration(app_configs, **kwargs):
     """Check prompt manager configuration for common issues."""
     errors = []
 
+    # Bind the environment once; every lookup below hits the same mapping
+    # and the PROMPT_* registration count is the only full scan
+    env = os.environ
+
     # Check if any source is configured
-    has_openai = bool(os.getenv("PROMPT_MANAGER_OPENAI_API_KEY"))
-    has_local = bool(os.getenv("PROMPT_MANAGER_PROMPTS_DIR"))
+    has_openai = bool(env.get("PROMPT_MANAGER_OPENAI_API_KEY"))
+    has_local = bool(env.get("PROMPT_MANAGER_PROMPTS_DIR"))
 
     if not (has_openai or has_local):
         errors.append(
@@ -27,7 +47,7 @@ def check_prompt_manager_configuration(app_configs, **kwargs):
         )
 
     # Check validation mode
-    validation_mode = os.getenv(
+    validation_mode = env.get(
         "PROMPT_MANAGER_VALIDATE_ON_STARTUP", "env_only"
     ).lower()
     valid_modes = ["none", "env_only", "load_test"]
@@ -41,13 +61,12 @@ def check_prompt_manager_configuration(app_configs, **kwargs):
             )
         )
 
-    # Check for prompt registrations
-    prompt_count = 0
-    for key in os.environ:
-        if key.startswith("PROMPT_") and key.endswith("_SOURCE"):
-            prompt_count += 1
+    # Check for prompt registrations (short-circuits on the first match)
+    has_prompts = any(
+        key.startswith("PROMPT_") and key.endswith("_SOURCE") for key in env
+    )
 
-    if prompt_count == 0 and (has_openai or has_local):
+    if not has_prompts and (has_openai or has_local):
         errors.append(
             Warning(
                 "No prompts registered via environment variables",
@@ -83,11 +102,8 @@ def check_prompt_manager_dependencies(app_configs, **kwargs):
     # Check for YAML support if needed
     has_yaml_files = False
     prompts_dir = os.getenv("PROMPT_MANAGER_PROMPTS_DIR")
-    if prompts_dir and os.path.exists(prompts_dir):
-        for root, dirs, files in os.walk(prompts_dir):
-            if any(f.endswith((".yaml", ".yml")) for f in files):
-                has_yaml_files = True
-                break
+    if prompts_dir and os.path.isdir(prompts_dir):
+        has_yaml_files = _has_yaml_files(prompts_dir)
 
     if has_yaml_files:
         try:
@@ -4,12 +4,70 @@ This module defines the abstract base class that all prompt sources must impleme
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class _BoundedCache:
+    """Bounded LRU cache for source-level prompt content.
+
+    Accessed entries move to the most-recently-used end and the LRU end
+    is evicted once max_entries is exceeded, so long-lived processes
+    cannot grow source caches without bound. An optional TTL (seconds)
+    expires entries lazily on read; 0/None means entries never expire.
+
+    All operations hold a lock: sources drive this cache from thread
+    pools (batch retrieval), and unguarded expiry/eviction could surface
+    as a KeyError from a concurrent read.
+    """
+
+    __slots__ = ("_data", "_max_entries", "_ttl", "_lock")
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl or None
+        self._lock = Lock()
+
+    def get(self, key: Any) -> Optional[str]:
+        """Return the cached content for key, or None if absent/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            content, expires_at = entry
+            if expires_at is not None and time.monotonic() > expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return content
+
+    def set(self, key: Any, content: str) -> None:
+        """Cache content under key, evicting LRU entries past the bound."""
+        expires_at = time.monotonic() + self._ttl if self._ttl else None
+        with self._lock:
+            self._data[key] = (content, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Drop key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class BasePromptSource(ABC):
     """Abstract base class for all prompt sources.
 
@@ -17,6 +75,8 @@ class BasePromptSource(ABC):
     by the PromptManager.
     """
 
+    __slots__ = ("config", "_initialized", "_exists_cache")
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the source with configuration.
 
@@ -25,6 +85,11 @@ class BasePromptSource(ABC):
         """
         self.config = config
         self._initialized = False
+        # (prompt_id, version) -> (exists, expires_at) probe results.
+        # Negative entries expire after config["negative_ttl"] seconds so
+        # a prompt published later is still picked up; positives after
+        # config["exists_ttl"] seconds so deletions are noticed too.
+        self._exists_cache: Dict[tuple, tuple] = {}
 
     @property
     @abstractmethod
@@ -79,6 +144,26 @@ class BasePromptSource(ABC):
         """
         pass
 
+    def get_prompts(
+        self, requests: List[Tuple[str, Optional[str]]]
+    ) -> List[str]:
+        """Retrieve several prompts in one call.
+
+        The default implementation loops over get_prompt; sources
+        override it with concurrent or batched strategies where their
+        I/O allows.
+
+        Args:
+            requests: (prompt_id, version) pairs to retrieve
+
+        Returns:
+            The prompt contents, in the same order as requests
+
+        Raises:
+            Same exceptions as get_prompt, for the first failing prompt
+        """
+        return [self.get_prompt(prompt_id, version) for prompt_id, version in requests]
+
     def validate_prompt_exists(
         self, prompt_id: str, version: Optional[str] = None
     ) -> bool:
@@ -94,11 +179,48 @@ class BasePromptSource(ABC):
         Returns:
             True if prompt exists, False otherwise
         """
+        key = (prompt_id, version)
+        cached = self._get_cached_exists(key)
+        if cached is not None:
+            return cached
+
         try:
             self.get_prompt(prompt_id, version)
-            return True
+            exists = True
         except Exception:
-            return False
+            exists = False
+
+        self._cache_exists(key, exists)
+        return exists
+
+    def _get_cached_exists(self, key: tuple) -> Optional[bool]:
+        """Return a cached existence result, or None if absent/expired."""
+        entry = self._exists_cache.get(key)
+        if entry is None:
+            return None
+        exists, expires_at = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            # pop rather than del: concurrent validators (thread-pool
+            # validation, batch retrieval) can race on the same expired
+            # entry, and the loser must not raise KeyError
+            self._exists_cache.pop(key, None)
+            return None
+        return exists
+
+    def _cache_exists(self, key: tuple, exists: bool) -> None:
+        """Record an existence probe result.
+
+        Negative results expire after negative_ttl seconds (default 60)
+        so a prompt published later is picked up; positives after
+        exists_ttl seconds (default 300) so a deleted or revoked prompt
+        stops validating. Either TTL can be set to 0 to never expire.
+        """
+        if exists:
+            ttl = self.config.get("exists_ttl", 300)
+        else:
+            ttl = self.config.get("negative_ttl", 60)
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._exists_cache[key] = (exists, expires_at)
 
     def _ensure_initialized(self) -> None:
         """Ensure the source is initialized before use."""
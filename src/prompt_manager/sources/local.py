@@ -7,10 +7,11 @@ prompts stored as files on the local filesystem.
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.exceptions import (
     ConfigurationError,
@@ -22,20 +23,81 @@ from ..core.exceptions import (
     PromptRetrievalError,
     SourceConnectionError,
 )
-from .base import BasePromptSource
+from .base import BasePromptSource, _BoundedCache
 
 logger = logging.getLogger(__name__)
 
+# Optional orjson support: Rust-backed parse/serialize, a few times
+# faster than the stdlib json module on both directions
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(data):
+        return json.dumps(data, indent=2)
+
+
+# Optional ijson support: stream large JSON prompt documents for their
+# "prompt" field instead of materializing the whole document
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional watchdog support: event-driven cache invalidation for
+# auto_reload instead of stat polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+    FileSystemEventHandler = object
+
 # Optional YAML support
 try:
     import yaml
 
+    # Prefer the libyaml-backed loader/dumper when PyYAML was built with
+    # it; the pure-Python tokenizer is roughly an order of magnitude slower
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as _YamlDumper
+        from yaml import SafeLoader as _YamlLoader
+
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
     logger.debug("PyYAML not installed. Install with: pip install pyyaml")
 
 
+class _CacheInvalidator(FileSystemEventHandler):
+    """Watchdog handler that drops source caches for changed files."""
+
+    def __init__(self, source: "LocalFileSource"):
+        self._source = source
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._source._invalidate_path(event.src_path)
+
+    on_created = on_modified
+    on_deleted = on_modified
+
+
 class LocalFileSource(BasePromptSource):
     """Source adapter for retrieving prompts from local files.
 
@@ -45,6 +107,23 @@ class LocalFileSource(BasePromptSource):
 
     SUPPORTED_EXTENSIONS = {".txt", ".text", ".json", ".yaml", ".yml"}
 
+    __slots__ = (
+        "_base_dir",
+        "_base_dir_str",
+        "_encoding",
+        "_auto_reload",
+        "_precompile",
+        "_cache",
+        "_file_mtimes",
+        "_mtime_check_interval",
+        "_last_scan",
+        "_scanned_mtimes",
+        "_path_cache",
+        "_template_cache",
+        "_observer",
+        "_json_stream_threshold",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize local file source.
 
@@ -53,13 +132,41 @@ class LocalFileSource(BasePromptSource):
                 - base_dir: Base directory for prompts (optional)
                 - encoding: File encoding (default: utf-8)
                 - auto_reload: Watch files for changes (default: False)
+                - precompile: Parse every prompt file under base_dir at
+                  initialization so retrieval is a dict lookup (default: False)
+                - cache_max_entries: Content cache bound (default: 1024)
+                - mtime_check_interval: Seconds between directory rescans
+                  in auto_reload mode (default: 1.0)
+                - json_stream_threshold: Stream-parse JSON files larger
+                  than this many bytes when ijson is installed
+                  (default: 65536)
         """
         super().__init__(config)
         self._base_dir = None
+        # String form of base_dir, resolved once; hot-path joins use it
+        # to avoid per-call Path construction and resolve() stat walks
+        self._base_dir_str = None
         self._encoding = config.get("encoding", "utf-8")
         self._auto_reload = config.get("auto_reload", False)
-        self._cache: Dict[str, str] = {}
+        self._precompile = config.get("precompile", False)
+        self._cache = _BoundedCache(config.get("cache_max_entries", 1024))
         self._file_mtimes: Dict[str, float] = {}
+        # Mtimes gathered by the throttled batch scan; lets
+        # _is_file_modified compare dicts instead of stat()ing per call
+        self._mtime_check_interval = config.get("mtime_check_interval", 1.0)
+        self._last_scan = 0.0
+        self._scanned_mtimes: Dict[str, float] = {}
+        # Set when watchdog is available: edits invalidate the cache as
+        # they happen and the polling machinery above is bypassed
+        self._observer = None
+        self._json_stream_threshold = config.get("json_stream_threshold", 64 * 1024)
+        # Successful (prompt_id, version, override) -> Path resolutions.
+        # Probing costs several stat calls and Path constructions, so it
+        # is paid once per distinct prompt rather than per retrieval.
+        self._path_cache: Dict[tuple, Path] = {}
+        # Parsed format-string tokens per template; None marks templates
+        # that need full str.format (attribute access, nested specs, ...)
+        self._template_cache: Dict[str, Optional[list]] = {}
 
     @property
     def source_type(self) -> str:
@@ -77,6 +184,7 @@ class LocalFileSource(BasePromptSource):
         base_dir = self.config.get("base_dir")
         if base_dir:
             self._base_dir = Path(base_dir).expanduser().resolve()
+            self._base_dir_str = str(self._base_dir)
             if not self._base_dir.exists():
                 raise ConfigurationError(
                     f"Prompts directory does not exist: {self._base_dir}"
@@ -88,9 +196,39 @@ class LocalFileSource(BasePromptSource):
             logger.info(
                 f"Local file source initialized with base directory: {self._base_dir}"
             )
+            if self._precompile:
+                self._precompile_prompts()
+            if self._auto_reload and HAS_WATCHDOG:
+                self._start_watcher()
         else:
             logger.info("Local file source initialized without base directory")
 
+    def _precompile_prompts(self) -> None:
+        """Parse every supported prompt file under base_dir into the cache.
+
+        For static prompt trees this moves all open/read/parse work to
+        initialization, so every subsequent retrieval is a dict lookup
+        with no syscalls or parser time on the hot path.
+        """
+        count = 0
+        for root, _dirs, files in os.walk(self._base_dir_str, followlinks=False):
+            for filename in files:
+                path = Path(root) / filename
+                if path.suffix not in self.SUPPORTED_EXTENSIONS:
+                    continue
+                try:
+                    content = self._read_file(path)
+                except Exception as e:
+                    logger.warning(f"Failed to precompile prompt {path}: {e}")
+                    continue
+                cache_key = str(path)
+                self._cache.set(cache_key, content)
+                if self._auto_reload:
+                    self._file_mtimes[cache_key] = path.stat().st_mtime
+                count += 1
+
+        logger.info(f"Precompiled {count} prompt files from {self._base_dir}")
+
     def get_prompt(
         self, prompt_id: str, version: Optional[str] = None, **kwargs
     ) -> str:
@@ -112,20 +250,30 @@ class LocalFileSource(BasePromptSource):
         """
         self._ensure_initialized()
 
-        # Determine file path
-        file_path = self._resolve_file_path(prompt_id, version, kwargs.get("path"))
+        # Determine file path, skipping the probing once a resolution
+        # has been proven good by a successful read
+        path_key = (prompt_id, version, kwargs.get("path"))
+        file_path = self._path_cache.get(path_key)
+        if file_path is None:
+            file_path = self._resolve_file_path(prompt_id, version, kwargs.get("path"))
 
-        # Check cache and file modification time
-        if self._auto_reload and str(file_path) in self._cache:
-            if self._is_file_modified(file_path):
+        # Check cache and file modification time. With a watcher running,
+        # changed files were already invalidated, so cache hits need no
+        # freshness check at all.
+        cache_key = str(file_path)
+        watching = self._observer is not None
+        if self._auto_reload and not watching:
+            self._refresh_mtimes()
+            if cache_key in self._cache and self._is_file_modified(file_path):
                 logger.debug(f"File {file_path} modified, reloading")
-                del self._cache[str(file_path)]
+                self._cache.pop(cache_key)
 
         # Return cached content if available
-        cache_key = str(file_path)
-        if cache_key in self._cache and not self._auto_reload:
-            logger.debug(f"Returning cached prompt from {file_path}")
-            return self._cache[cache_key]
+        if not self._auto_reload or watching:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Returning cached prompt from {file_path}")
+                return cached
 
         # Read the file
         try:
@@ -136,9 +284,10 @@ class LocalFileSource(BasePromptSource):
             if variables:
                 content = self._substitute_variables(content, variables)
 
-            # Cache the content
-            self._cache[cache_key] = content
-            if self._auto_reload:
+            # Cache the content and the proven path resolution
+            self._cache.set(cache_key, content)
+            self._path_cache[path_key] = file_path
+            if self._auto_reload and not watching:
                 self._file_mtimes[cache_key] = file_path.stat().st_mtime
 
             logger.info(f"Successfully loaded prompt from {file_path}")
@@ -151,6 +300,24 @@ class LocalFileSource(BasePromptSource):
         except Exception as e:
             raise PromptRetrievalError(prompt_id, self.source_type, e)
 
+    def get_prompts(
+        self, requests: List[Tuple[str, Optional[str]]]
+    ) -> List[str]:
+        """Retrieve several prompts, reading files concurrently.
+
+        File reads release the GIL, so a small thread pool turns N
+        sequential opens into roughly N/io_workers of wall-clock time.
+        Order is preserved; config io_workers bounds the pool (default 8).
+        """
+        if len(requests) <= 1:
+            return [self.get_prompt(p, v) for p, v in requests]
+
+        workers = min(self.config.get("io_workers", 8), len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda request: self.get_prompt(*request), requests)
+            )
+
     def _resolve_file_path(
         self, prompt_id: str, version: Optional[str], override_path: Optional[str]
     ) -> Path:
@@ -167,26 +334,35 @@ class LocalFileSource(BasePromptSource):
         Raises:
             PromptNotFoundError: If no valid file found
         """
-        # Use override path if provided
+        # Fast path: the common "prompts/foo.txt" shape (no override, no
+        # version, extension already present) needs none of the probing
+        # below, and base_dir is already resolved so joining is enough
+        if override_path is None and version is None:
+            base_path = Path(prompt_id)
+            if base_path.suffix in self.SUPPORTED_EXTENSIONS:
+                if base_path.is_absolute():
+                    return Path(os.path.abspath(os.path.expanduser(prompt_id)))
+                if self._base_dir_str is not None:
+                    return Path(os.path.join(self._base_dir_str, prompt_id))
+                return Path(os.path.abspath(prompt_id))
+
+        # Use override path if provided; abspath normalizes without the
+        # per-component stat walk that resolve() performs
         if override_path:
-            path = Path(override_path).expanduser()
-            # If override path is relative and we have a base_dir, resolve relative to base_dir
-            if not path.is_absolute() and self._base_dir:
-                return (self._base_dir / path).resolve()
-            return path.resolve()
+            path = os.path.expanduser(override_path)
+            if not os.path.isabs(path) and self._base_dir_str:
+                return Path(os.path.join(self._base_dir_str, path))
+            return Path(os.path.abspath(path))
 
         # Start with prompt_id as base
-        base_path = Path(prompt_id)
-
-        # If absolute path, use as-is
-        if base_path.is_absolute():
-            file_path = base_path.expanduser().resolve()
+        if os.path.isabs(prompt_id):
+            file_path = Path(os.path.abspath(os.path.expanduser(prompt_id)))
         else:
             # Relative to base_dir if configured
-            if self._base_dir:
-                file_path = (self._base_dir / base_path).resolve()
+            if self._base_dir_str:
+                file_path = Path(os.path.join(self._base_dir_str, prompt_id))
             else:
-                file_path = base_path.resolve()
+                file_path = Path(os.path.abspath(prompt_id))
 
         # Handle version suffix
         if version:
@@ -228,19 +404,48 @@ class LocalFileSource(BasePromptSource):
             raise FileNotFoundError(file_path)
 
         try:
-            with open(file_path, "r", encoding=self._encoding) as f:
-                content = f.read()
+            # Large JSON documents: stream out just the "prompt" field
+            # instead of materializing the whole object tree
+            if (
+                ijson is not None
+                and file_path.suffix == ".json"
+                and os.path.getsize(file_path) > self._json_stream_threshold
+            ):
+                prompt = self._stream_json_prompt(file_path)
+                if prompt is not None:
+                    return prompt
+
+            # Single pre-sized read on a raw fd: the buffered text-IO
+            # layer is pure overhead for small prompt files, and decoding
+            # once against a right-sized bytes object avoids buffer growth
+            fd = os.open(str(file_path), os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                raw = os.read(fd, size)
+                if len(raw) < size:
+                    # Short read (rare; e.g. file grown or special file):
+                    # fall back to chunked reads until EOF
+                    parts = [raw]
+                    while True:
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            break
+                        parts.append(chunk)
+                    raw = b"".join(parts)
+            finally:
+                os.close(fd)
+            content = raw.decode(self._encoding)
 
             # Handle different file formats
             if file_path.suffix in {".json"}:
                 # Validate JSON and extract prompt field if present
-                data = json.loads(content)
+                data = _json_loads(content)
                 if isinstance(data, dict) and "prompt" in data:
                     return data["prompt"]
                 elif isinstance(data, str):
                     return data
                 else:
-                    return json.dumps(data, indent=2)
+                    return _json_dumps(data)
 
             elif file_path.suffix in {".yaml", ".yml"}:
                 if not HAS_YAML:
@@ -250,14 +455,20 @@ class LocalFileSource(BasePromptSource):
                     )
                     return content
 
-                # Validate YAML and extract prompt field if present
-                data = yaml.safe_load(content)
+                # Validate YAML and extract prompt field if present.
+                # Driving the loader directly skips yaml.load's wrapper
+                # (signature handling, loader dispatch) on every parse.
+                loader = _YamlLoader(content)
+                try:
+                    data = loader.get_single_data()
+                finally:
+                    loader.dispose()
                 if isinstance(data, dict) and "prompt" in data:
                     return data["prompt"]
                 elif isinstance(data, str):
                     return data
                 else:
-                    return yaml.dump(data)
+                    return yaml.dump(data, Dumper=_YamlDumper)
 
             # Plain text
             return content.strip()
@@ -265,6 +476,23 @@ class LocalFileSource(BasePromptSource):
         except Exception as e:
             raise FileReadError(str(file_path), e)
 
+    @staticmethod
+    def _stream_json_prompt(file_path: Path) -> Optional[str]:
+        """Stream-parse a large JSON file for its top-level "prompt" field.
+
+        Keeps peak memory at O(prompt) rather than O(document). Returns
+        None when the document has no string "prompt" field or cannot be
+        streamed, in which case the caller falls back to a full parse.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                for key, value in ijson.kvitems(f, ""):
+                    if key == "prompt" and isinstance(value, str):
+                        return value
+        except Exception:
+            return None
+        return None
+
     def _substitute_variables(self, content: str, variables: Dict[str, Any]) -> str:
         """Substitute variables in prompt content.
 
@@ -277,13 +505,108 @@ class LocalFileSource(BasePromptSource):
         Returns:
             Content with substituted variables
         """
+        # No placeholders: skip parsing and return the original string
+        # rather than allocating a copy
+        if "{" not in content:
+            return content
+
+        tokens = self._template_cache.get(content, False)
+        if tokens is False:
+            tokens = self._parse_template(content)
+            self._template_cache[content] = tokens
+
+        if tokens is None:
+            # Complex template: defer to str.format, which re-parses
+            try:
+                return content.format(**variables)
+            except KeyError as e:
+                logger.warning(f"Missing variable for substitution: {e}")
+                # Return content as-is if substitution fails
+                return content
+
+        parts = []
         try:
-            return content.format(**variables)
+            for literal, field in tokens:
+                if literal:
+                    parts.append(literal)
+                if field is not None:
+                    parts.append(str(variables[field]))
+            return "".join(parts)
         except KeyError as e:
             logger.warning(f"Missing variable for substitution: {e}")
-            # Return content as-is if substitution fails
             return content
 
+    @staticmethod
+    def _parse_template(content: str) -> Optional[list]:
+        """Parse a template into (literal, field) tokens.
+
+        Returns None when the template uses features beyond plain named
+        placeholders (conversions, format specs, attribute/index access),
+        in which case substitution falls back to str.format.
+        """
+        try:
+            tokens = []
+            for literal, field, spec, conversion in Formatter().parse(content):
+                if conversion or spec:
+                    return None
+                if field is not None and (
+                    not field or "." in field or "[" in field
+                ):
+                    return None
+                tokens.append((literal, field))
+            return tokens
+        except ValueError:
+            return None
+
+    def _start_watcher(self) -> None:
+        """Start an event-driven filesystem watcher for the prompt tree.
+
+        Edits invalidate affected cache entries as they happen, so
+        get_prompt serves cache hits with zero stat calls. Without
+        watchdog installed, auto_reload falls back to throttled polling.
+        """
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_CacheInvalidator(self), self._base_dir_str, recursive=True)
+        observer.start()
+        self._observer = observer
+        logger.info(f"Watching {self._base_dir} for prompt changes")
+
+    def _invalidate_path(self, path: str) -> None:
+        """Drop caches for a file reported changed by the watcher."""
+        self._cache.pop(path)
+        self._file_mtimes.pop(path, None)
+
+    def _refresh_mtimes(self) -> None:
+        """Refresh tracked file mtimes with one batched directory scan.
+
+        Throttled to mtime_check_interval seconds, so the whole working
+        set is covered by a single scandir walk per interval instead of
+        one stat syscall per retrieval.
+        """
+        if self._base_dir is None:
+            return
+
+        now = time.monotonic()
+        if now - self._last_scan < self._mtime_check_interval:
+            return
+        self._last_scan = now
+
+        mtimes: Dict[str, float] = {}
+        stack = [self._base_dir_str]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            mtimes[entry.path] = entry.stat().st_mtime
+            except OSError:
+                continue
+        self._scanned_mtimes = mtimes
+
     def _is_file_modified(self, file_path: Path) -> bool:
         """Check if a file has been modified since last read.
 
@@ -297,11 +620,15 @@ class LocalFileSource(BasePromptSource):
         if cache_key not in self._file_mtimes:
             return True
 
-        try:
-            current_mtime = file_path.stat().st_mtime
-            return current_mtime > self._file_mtimes[cache_key]
-        except Exception:
-            return True
+        # Prefer the batch-scanned mtime; fall back to a direct stat for
+        # files outside base_dir (absolute paths, overrides)
+        current_mtime = self._scanned_mtimes.get(cache_key)
+        if current_mtime is None:
+            try:
+                current_mtime = file_path.stat().st_mtime
+            except Exception:
+                return True
+        return current_mtime > self._file_mtimes[cache_key]
 
     def validate_connection(self) -> bool:
         """Validate local file source.
@@ -332,9 +659,17 @@ class LocalFileSource(BasePromptSource):
         Returns:
             True if file exists
         """
+        key = (prompt_id, version)
+        cached = self._get_cached_exists(key)
+        if cached is not None:
+            return cached
+
         try:
             self._ensure_initialized()
             file_path = self._resolve_file_path(prompt_id, version, None)
-            return file_path.exists() and file_path.is_file()
+            exists = file_path.exists() and file_path.is_file()
         except Exception:
-            return False
+            exists = False
+
+        self._cache_exists(key, exists)
+        return exists
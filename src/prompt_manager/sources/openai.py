@@ -4,9 +4,13 @@ This adapter implements the BasePromptSource interface to retrieve
 prompts stored in OpenAI's prompt management system.
 """
 
+import asyncio
+import hashlib
 import logging
+import random
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.exceptions import (
     ConfigurationError,
@@ -17,19 +21,43 @@ from ..core.exceptions import (
     PromptRetrievalError,
     SourceConnectionError,
 )
-from .base import BasePromptSource
+from .base import BasePromptSource, _BoundedCache
 
 logger = logging.getLogger(__name__)
 
 # Optional OpenAI import
 try:
-    from openai import OpenAI
+    from openai import (
+        APITimeoutError,
+        AsyncOpenAI,
+        NotFoundError,
+        OpenAI,
+        RateLimitError,
+    )
 
     HAS_OPENAI = True
 except ImportError:
     HAS_OPENAI = False
     logger.debug("OpenAI library not installed. Install with: pip install openai")
 
+# Clients shared by sources with identical credentials, so many source
+# instances reuse one connection pool (keep-alive, TLS context) instead
+# of each paying client construction. Keyed by a digest of the API key
+# rather than the key itself.
+_CLIENT_CACHE: Dict[str, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def clear_client_cache() -> None:
+    """Drop all pooled OpenAI clients.
+
+    Sources initialized afterwards construct fresh clients; already
+    initialized sources keep the client they hold. Mirrors
+    clear_config_cache() for tests and credential rotation.
+    """
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.clear()
+
 
 class OpenAIPromptSource(BasePromptSource):
     """Source adapter for retrieving prompts from OpenAI.
@@ -38,6 +66,8 @@ class OpenAIPromptSource(BasePromptSource):
     versioned prompts using the responses.create API.
     """
 
+    __slots__ = ("_client", "_cache", "_content_pool")
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize OpenAI source.
 
@@ -46,10 +76,24 @@ class OpenAIPromptSource(BasePromptSource):
                 - api_key: OpenAI API key (required)
                 - timeout: Request timeout in seconds (default: 30)
                 - max_retries: Maximum retry attempts (default: 3)
+                - cache_max_entries: Content cache bound (default: 1024)
+                - cache_ttl_seconds: Expire cached prompts after this many
+                  seconds, so "latest" entries don't go stale forever
+                  (default: no expiry)
+                - concurrency: Max in-flight requests for async batch
+                  retrieval (default: 8)
         """
         super().__init__(config)
         self._client = None
-        self._cache: Dict[str, str] = {}
+        self._cache = _BoundedCache(
+            config.get("cache_max_entries", 1024),
+            config.get("cache_ttl_seconds"),
+        )
+        # Dedup pool so identical bodies cached under several version
+        # aliases ("v1", "latest", ...) share one backing string. A plain
+        # dict rather than WeakValueDictionary: str does not support
+        # weak references.
+        self._content_pool: Dict[str, str] = {}
 
     @property
     def source_type(self) -> str:
@@ -76,7 +120,13 @@ class OpenAIPromptSource(BasePromptSource):
             )
 
         try:
-            self._client = OpenAI(api_key=api_key)
+            digest = hashlib.sha256(api_key.encode()).hexdigest()
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(digest)
+                if client is None:
+                    client = OpenAI(api_key=api_key)
+                    _CLIENT_CACHE[digest] = client
+            self._client = client
             logger.info("OpenAI client initialized for prompt retrieval")
         except Exception as e:
             raise SourceConnectionError(f"Failed to initialize OpenAI client: {str(e)}")
@@ -100,11 +150,13 @@ class OpenAIPromptSource(BasePromptSource):
         """
         self._ensure_initialized()
 
-        # Check cache first
-        cache_key = f"{prompt_id}:{version or 'latest'}"
-        if cache_key in self._cache:
+        # Check cache first; a (prompt_id, version) tuple hashes without
+        # building an intermediate string, with None standing for "latest"
+        cache_key = (prompt_id, version)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.debug(f"Returning cached prompt for {cache_key}")
-            return self._cache[cache_key]
+            return cached
 
         # Retry logic
         max_retries = self.config.get("max_retries", 3)
@@ -117,70 +169,183 @@ class OpenAIPromptSource(BasePromptSource):
                     f"(version: {version or 'latest'}, attempt: {attempt + 1})"
                 )
 
-                # Build prompt configuration
-                prompt_config = {"id": prompt_id}
-                if version:
-                    prompt_config["version"] = version
-
                 # Use responses.create to retrieve the prompt
                 response = self._client.responses.create(
-                    prompt=prompt_config, timeout=timeout
+                    prompt=self._build_prompt_config(prompt_id, version),
+                    timeout=timeout,
                 )
 
-                # Extract prompt text from response
-                prompt_text = self._extract_prompt_text(response)
+                prompt_text = self._finish_retrieval(cache_key, prompt_id, response)
+                return prompt_text
 
-                if not prompt_text:
-                    raise PromptNotFoundError(
-                        prompt_id,
-                        self.source_type,
-                        "Prompt retrieved but content is empty",
-                    )
+            except Exception as e:
+                wait_time = self._classify_retry(e, prompt_id, attempt, max_retries)
+                if wait_time:
+                    time.sleep(wait_time)
+
+    async def get_prompts_async(
+        self,
+        prompt_ids: List[Tuple[str, Optional[str]]],
+        concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """Retrieve several prompts concurrently via the async client.
+
+        Wall-clock time for N uncached prompts drops from N round-trips
+        to roughly N/concurrency. Results come back in the same order as
+        prompt_ids; cached entries are served without a request, and the
+        cache is shared with the synchronous path.
 
-                # Cache the result
-                self._cache[cache_key] = prompt_text
-                logger.info(f"Successfully retrieved prompt {prompt_id}")
+        Args:
+            prompt_ids: (prompt_id, version) pairs to retrieve
+            concurrency: Max in-flight requests (default from config)
 
-                return prompt_text
+        Returns:
+            The prompt contents, in order
 
-            except Exception as e:
-                error_str = str(e).lower()
-
-                # Determine error type
-                if "not found" in error_str or "404" in error_str:
-                    raise PromptNotFoundError(
-                        prompt_id,
-                        self.source_type,
-                        f"Prompt ID may be invalid or inaccessible",
-                    )
-                elif "rate limit" in error_str or "too many requests" in error_str:
-                    if attempt < max_retries - 1:
-                        wait_time = 2**attempt
-                        logger.warning(
-                            f"Rate limit hit, retrying in {wait_time} seconds..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise OpenAIRateLimitError(
-                            f"Rate limit exceeded after {max_retries} attempts"
-                        )
-                elif "timeout" in error_str:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Request timed out, retrying...")
-                        continue
-                    else:
-                        raise OpenAITimeoutError(
-                            f"Request timed out after {max_retries} attempts"
-                        )
-                else:
-                    # Generic error
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Request failed: {e}, retrying...")
-                        time.sleep(1)
-                        continue
-                    else:
-                        raise PromptRetrievalError(prompt_id, self.source_type, e)
+        Raises:
+            Same exceptions as get_prompt, for the first failing prompt
+        """
+        self._ensure_initialized()
+
+        max_retries = self.config.get("max_retries", 3)
+        timeout = self.config.get("timeout", 30)
+        semaphore = asyncio.Semaphore(
+            concurrency or self.config.get("concurrency", 8)
+        )
+
+        # The client is scoped to this call rather than cached on the
+        # source: its connection pool is bound to the running loop, and a
+        # pool created under one asyncio.run would fail under the next
+        async with AsyncOpenAI(api_key=self.config.get("api_key")) as client:
+
+            async def _fetch_one(prompt_id: str, version: Optional[str]) -> str:
+                cache_key = (prompt_id, version)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                async with semaphore:
+                    for attempt in range(max_retries):
+                        try:
+                            response = await client.responses.create(
+                                prompt=self._build_prompt_config(prompt_id, version),
+                                timeout=timeout,
+                            )
+                            return self._finish_retrieval(
+                                cache_key, prompt_id, response
+                            )
+                        except Exception as e:
+                            wait_time = self._classify_retry(
+                                e, prompt_id, attempt, max_retries
+                            )
+                            if wait_time:
+                                await asyncio.sleep(wait_time)
+
+            return list(
+                await asyncio.gather(*(_fetch_one(p, v) for p, v in prompt_ids))
+            )
+
+    def get_prompts(
+        self, requests: List[Tuple[str, Optional[str]]]
+    ) -> List[str]:
+        """Retrieve several prompts, fetching them concurrently.
+
+        Dispatches to the async batch path so N uncached prompts cost
+        roughly N/concurrency round-trips. Falls back to the sequential
+        default when already running inside an event loop, where
+        asyncio.run is unavailable.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.get_prompts_async(requests))
+        return super().get_prompts(requests)
+
+    @staticmethod
+    def _build_prompt_config(
+        prompt_id: str, version: Optional[str]
+    ) -> Dict[str, str]:
+        """Build the prompt parameter for responses.create."""
+        prompt_config = {"id": prompt_id}
+        if version:
+            prompt_config["version"] = version
+        return prompt_config
+
+    def _finish_retrieval(
+        self, cache_key: Tuple[str, Optional[str]], prompt_id: str, response
+    ) -> str:
+        """Extract, validate and cache the prompt text from a response."""
+        prompt_text = self._extract_prompt_text(response)
+
+        if not prompt_text:
+            raise PromptNotFoundError(
+                prompt_id,
+                self.source_type,
+                "Prompt retrieved but content is empty",
+            )
+
+        prompt_text = self._content_pool.setdefault(prompt_text, prompt_text)
+        self._cache.set(cache_key, prompt_text)
+        logger.info(f"Successfully retrieved prompt {prompt_id}")
+        return prompt_text
+
+    def _classify_retry(
+        self, e: Exception, prompt_id: str, attempt: int, max_retries: int
+    ) -> float:
+        """Map a retrieval error to a backoff delay, or raise its final form.
+
+        Returns the seconds to wait before the next attempt (0 for an
+        immediate retry); raises when the error is terminal or retries
+        are exhausted.
+        """
+        if isinstance(e, PromptNotFoundError):
+            raise e
+
+        if HAS_OPENAI and isinstance(
+            e, (NotFoundError, RateLimitError, APITimeoutError)
+        ):
+            # Typed SDK exceptions: no message sniffing needed, and robust
+            # to wording changes in the SDK
+            not_found = isinstance(e, NotFoundError)
+            rate_limited = isinstance(e, RateLimitError)
+            timed_out = isinstance(e, APITimeoutError)
+        else:
+            error_str = str(e).lower()
+            not_found = "not found" in error_str or "404" in error_str
+            rate_limited = (
+                "rate limit" in error_str or "too many requests" in error_str
+            )
+            timed_out = "timeout" in error_str
+
+        if not_found:
+            raise PromptNotFoundError(
+                prompt_id,
+                self.source_type,
+                "Prompt ID may be invalid or inaccessible",
+            )
+        if rate_limited:
+            if attempt < max_retries - 1:
+                # Jitter spreads out simultaneous retries
+                wait_time = 2**attempt + random.uniform(0, 0.5)
+                logger.warning(
+                    f"Rate limit hit, retrying in {wait_time:.1f} seconds..."
+                )
+                return wait_time
+            raise OpenAIRateLimitError(
+                f"Rate limit exceeded after {max_retries} attempts"
+            )
+        if timed_out:
+            if attempt < max_retries - 1:
+                logger.warning("Request timed out, retrying...")
+                return 0.0
+            raise OpenAITimeoutError(
+                f"Request timed out after {max_retries} attempts"
+            )
+        # Generic error
+        if attempt < max_retries - 1:
+            logger.warning(f"Request failed: {e}, retrying...")
+            return 1.0
+        raise PromptRetrievalError(prompt_id, self.source_type, e)
 
     def _extract_prompt_text(self, response) -> str:
         """Extract prompt text from OpenAI response.
@@ -195,25 +360,24 @@ class OpenAIPromptSource(BasePromptSource):
             PromptRetrievalError: If response structure is unexpected
         """
         try:
-            # Handle the response structure from responses.create
-            if (
-                hasattr(response, "instructions")
-                and response.instructions
-                and len(response.instructions) > 0
-                and hasattr(response.instructions[0], "content")
-                and response.instructions[0].content
-                and len(response.instructions[0].content) > 0
-                and hasattr(response.instructions[0].content[0], "text")
-            ):
-
+            # EAFP: reach straight for the expected structure and fall
+            # through on failure, instead of a chain of hasattr/len
+            # checks paid on every successful response
+            try:
                 return response.instructions[0].content[0].text
+            except (AttributeError, IndexError, TypeError):
+                pass
 
             # Alternative response structures
-            if hasattr(response, "content"):
+            try:
                 return response.content
+            except AttributeError:
+                pass
 
-            if hasattr(response, "text"):
+            try:
                 return response.text
+            except AttributeError:
+                pass
 
             raise ValueError("Unexpected response structure")
 
@@ -255,11 +419,19 @@ class OpenAIPromptSource(BasePromptSource):
         Returns:
             True if prompt exists
         """
+        key = (prompt_id, version)
+        cached = self._get_cached_exists(key)
+        if cached is not None:
+            return cached
+
         try:
             self.get_prompt(prompt_id, version)
-            return True
+            exists = True
         except PromptNotFoundError:
-            return False
+            exists = False
         except Exception as e:
             logger.error(f"Error checking prompt existence: {e}")
-            return False
+            exists = False
+
+        self._cache_exists(key, exists)
+        return exists
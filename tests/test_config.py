@@ -1,6 +1,8 @@
 """Tests for configuration management."""
 
+import importlib.util
 import os
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -10,6 +12,7 @@ from prompt_manager.core.config import (
     PromptManagerConfig,
     SourceType,
     ValidationMode,
+    clear_config_cache,
     get_config,
     reset_config,
 )
@@ -138,6 +141,84 @@ class TestPromptManagerConfig:
         assert len(errors) > 0
         assert "prompt ID configured" in errors[0]
 
+    def test_validate_sources_fail_fast(self):
+        """Test stop_at_first_error stops after one error."""
+        config = PromptManagerConfig(
+            openai_api_key="sk-test",
+            prompts={
+                "a": PromptConfig(
+                    name="a", source=SourceType.OPENAI, source_config={}
+                ),
+                "b": PromptConfig(
+                    name="b", source=SourceType.LOCAL, source_config={}
+                ),
+            },
+        )
+
+        # Full scan reports every problem; fail-fast reports only the first
+        assert len(config.validate_sources()) > 1
+        errors = config.validate_sources(stop_at_first_error=True)
+        assert len(errors) == 1
+
+
+class TestDataclassFallback:
+    """Test the no-pydantic dataclass fallback path."""
+
+    @pytest.fixture
+    def fallback_config(self):
+        """Load a private copy of the config module with pydantic hidden.
+
+        A separate module object keeps the fallback classes isolated, so
+        the real (pydantic-backed) module used by the rest of the suite
+        is untouched.
+        """
+        import prompt_manager.core.config as real_config
+
+        spec = importlib.util.spec_from_file_location(
+            "prompt_manager.core._config_fallback", real_config.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"pydantic": None}):
+            spec.loader.exec_module(module)
+
+        assert module.HAS_PYDANTIC is False
+        return module
+
+    def test_string_source_coerced_to_enum(self, fallback_config):
+        """Test string sources become enum members without pydantic."""
+        config = fallback_config.PromptConfig(
+            name="test", source="local", source_config={"path": "a.txt"}
+        )
+
+        # Identity, not just equality: enum dispatch in the core uses 'is'
+        assert config.source is fallback_config.SourceType.LOCAL
+
+    def test_string_settings_coerced_to_enum(self, fallback_config):
+        """Test manager-level string settings become enum members."""
+        config = fallback_config.PromptManagerConfig(
+            default_source="openai", validate_on_startup="none"
+        )
+
+        assert config.default_source is fallback_config.SourceType.OPENAI
+        assert config.validate_on_startup is fallback_config.ValidationMode.NONE
+
+    def test_validate_sources_sees_string_built_prompts(self, fallback_config):
+        """Test validation still dispatches on string-built prompt configs."""
+        config = fallback_config.PromptManagerConfig(
+            openai_api_key="sk-test",
+            prompts={
+                "test": fallback_config.PromptConfig(
+                    name="test",
+                    source="openai",
+                    source_config={},  # Missing prompt_id
+                )
+            },
+        )
+
+        errors = config.validate_sources()
+        assert len(errors) > 0
+        assert "prompt ID configured" in errors[0]
+
 
 class TestSourceType:
     """Test SourceType enum functionality."""
@@ -184,6 +265,7 @@ class TestValidationMode:
         assert "Invalid validation mode" in str(exc_info.value)
 
 
+@pytest.mark.resets_singletons
 class TestGlobalConfig:
     """Test global configuration management."""
 
@@ -196,10 +278,28 @@ class TestGlobalConfig:
 
         assert config1 is config2  # Same instance
 
-    def test_reset_config(self):
-        """Test resetting global config."""
+    def test_reset_config_reuses_memoized_parse(self):
+        """Test reset_config reuses the parsed config when env is unchanged."""
+        config1 = get_config()
+        reset_config()
+        config2 = get_config()
+
+        assert config1 is config2  # Environment unchanged, parse reused
+
+    def test_reset_config_reparses_on_env_change(self, monkeypatch):
+        """Test that changing the environment invalidates the memoized parse."""
         config1 = get_config()
+        monkeypatch.setenv("PROMPT_MANAGER_CACHE_TTL", "1234")
         reset_config()
         config2 = get_config()
 
+        assert config1 is not config2
+        assert config2.cache_ttl == 1234
+
+    def test_clear_config_cache(self):
+        """Test clear_config_cache forces a full re-parse."""
+        config1 = get_config()
+        clear_config_cache()
+        config2 = get_config()
+
         assert config1 is not config2  # Different instances
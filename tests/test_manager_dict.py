@@ -91,6 +91,20 @@ class TestPromptManagerDictConfig:
         result_with_vars = manager.get("greeting", variables={"name": "World"})
         assert result_with_vars == "Hello World!"
 
+    def test_get_prompt_batch(self, temp_prompts_dir):
+        """Test batch rendering of one prompt against many variable dicts."""
+        config = {
+            "prompts": {"greeting": {"source": "local", "path": "greeting.txt"}},
+            "sources": {"local": {"base_dir": temp_prompts_dir}},
+        }
+
+        manager = PromptManager(config)
+
+        results = manager.get_prompt_batch(
+            "greeting", [{"name": "Alice"}, {"name": "Bob"}]
+        )
+        assert results == ["Hello Alice!", "Hello Bob!"]
+
     def test_dict_config_matches_readme_example(self, mock_openai_client):
         """Test that README example configuration works."""
         # This is the exact format shown in the README
@@ -0,0 +1,23 @@
+"""Tests for prompt source adapters."""
+
+from prompt_manager.sources.local import LocalFileSource
+
+
+class TestLocalFileSourceBatch:
+    """Test batch retrieval on the local file source."""
+
+    def test_get_prompts_preserves_order(self, temp_prompts_dir):
+        """Test batch results come back in request order."""
+        source = LocalFileSource({"base_dir": temp_prompts_dir})
+
+        # Three requests across two files; the thread-pool path must
+        # still return contents in request order, duplicates included
+        results = source.get_prompts(
+            [("greeting.txt", None), ("welcome.txt", None), ("greeting.txt", None)]
+        )
+
+        assert results == [
+            "Hello {name}!",
+            "Welcome to our service",
+            "Hello {name}!",
+        ]